@@ -18,16 +18,29 @@ logger = logging.getLogger(__name__)
 
 PAGES: dict = {}  # populated inside render_app() to avoid circular at import
 
+# Static sidebar content — built once at import, not on every rerun.
+STATUS_ICONS = {
+	"NOT_STARTED": "—",
+	"IN_PROGRESS": "🔄",
+	"COMPLETE": "✅",
+	"FAILED": "❌",
+}
+
+STAGE_LABELS = {
+	"stage1": "Descoberta",
+	"stage2": "Extração Contrato",
+	"stage3": "Extração Publicação",
+	"stage4": "Análise Compliance",
+	"stage5": "Conformidade",
+	"stage6_alerts": "Alertas",
+}
+
 
 def render_app() -> None:
 	"""Entry point for all UI logic. Called from __main__ only."""
 	try:
 		import streamlit as st
 		from infrastructure.dashboard.pipeline_runner import get_stage_status, is_any_running
-		control = importlib.import_module("application.pages.control")
-		explorer = importlib.import_module("application.pages.explorer")
-		analytics = importlib.import_module("application.pages.analytics")
-		errors_page = importlib.import_module("application.pages.errors")
 
 		st.set_page_config(
 			page_title="TCM-Rio | Análise de Contratos",
@@ -36,18 +49,12 @@ def render_app() -> None:
 			initial_sidebar_state="expanded",
 		)
 
+		# Module paths, not modules: only the selected page is imported.
 		pages = {
-			"🎛️ Controle do Pipeline": control,
-			"🔍 Explorador de Dados": explorer,
-			"📊 Análise e Filtros": analytics,
-			"⚠️ Erros e Reprocessamento": errors_page,
-		}
-
-		status_icons = {
-			"NOT_STARTED": "—",
-			"IN_PROGRESS": "🔄",
-			"COMPLETE": "✅",
-			"FAILED": "❌",
+			"🎛️ Controle do Pipeline": "application.pages.control",
+			"🔍 Explorador de Dados": "application.pages.explorer",
+			"📊 Análise e Filtros": "application.pages.analytics",
+			"⚠️ Erros e Reprocessamento": "application.pages.errors",
 		}
 
 		with st.sidebar:
@@ -58,19 +65,14 @@ def render_app() -> None:
 			selection = st.radio("NAVEGAÇÃO", list(pages.keys()), label_visibility="collapsed")
 			st.divider()
 
-			st.markdown("**STATUS DO PIPELINE**")
-			stage_labels = {
-				"stage1": "Descoberta",
-				"stage2": "Extração Contrato",
-				"stage3": "Extração Publicação",
-				"stage4": "Análise Compliance",
-				"stage5": "Conformidade",
-				"stage6_alerts": "Alertas",
-			}
-			for key, label in stage_labels.items():
+			# One markdown element for the heading and all stages instead of
+			# one per line.
+			status_lines = ["**STATUS DO PIPELINE**\n"]
+			for key, label in STAGE_LABELS.items():
 				s = get_stage_status(key)
-				icon = status_icons.get(s.get("status", ""), "—")
-				st.write(f"{icon} {label}")
+				icon = STATUS_ICONS.get(s.get("status", ""), "—")
+				status_lines.append(f"{icon} {label}")
+			st.markdown("  \n".join(status_lines))
 
 			if st.button("🔄 Atualizar status"):
 				st.cache_data.clear()
@@ -81,7 +83,7 @@ def render_app() -> None:
 			if running:
 				st.info("⏳ Executando...")
 
-		pages[selection].render()
+		importlib.import_module(pages[selection]).render()
 	except Exception as exc:
 		logger.warning("Failed to render app: %s", exc)
 
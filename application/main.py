@@ -5,6 +5,7 @@ import sys
 import argparse
 from pathlib import Path
 import logging
+import traceback
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -88,7 +89,6 @@ def main():
     
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
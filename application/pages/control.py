@@ -156,33 +156,43 @@ def render() -> None:
                     st.warning("Solicitação de parada enviada.")
 
         with col_right:
-            stage_map = {
-                "stage1": "Descoberta",
-                "stage2": "Contrato",
-                "stage3": "Publicação",
-                "stage4": "Compliance",
-                "stage5": "Conformidade",
-                "stage6_alerts": "Alertas",
-            }
-            for key, label in stage_map.items():
-                s = get_stage_status(key)
-                pct = float(s.get("progress_pct", 0.0) or 0.0) / 100
-                st.write(
-                    f"**{label}** — {str(s.get('status', 'NOT_STARTED'))} "
-                    f"({int(s.get('completed', 0) or 0)}/{int(s.get('total', 0) or 0)})"
-                )
-                st.progress(pct)
+            live = is_any_running()
+
+            # While a stage runs, only this panel refreshes (every 1.5 s);
+            # the controls on the left are not re-rendered on each tick.
+            @st.fragment(run_every=1.5 if live else None)
+            def _live_panel() -> None:
+                stage_map = {
+                    "stage1": "Descoberta",
+                    "stage2": "Contrato",
+                    "stage3": "Publicação",
+                    "stage4": "Compliance",
+                    "stage5": "Conformidade",
+                    "stage6_alerts": "Alertas",
+                }
+                for key, label in stage_map.items():
+                    s = get_stage_status(key)
+                    pct = float(s.get("progress_pct", 0.0) or 0.0) / 100
+                    # Label rides on the bar itself: one element per stage.
+                    st.progress(
+                        pct,
+                        text=(
+                            f"**{label}** — {str(s.get('status', 'NOT_STARTED'))} "
+                            f"({int(s.get('completed', 0) or 0)}/{int(s.get('total', 0) or 0)})"
+                        ),
+                    )
 
-            st.subheader("📋 Log")
-            running = get_running_stage()
-            log_stage = running or "stage4"
-            log_lines = read_log_tail(log_stage, lines=30)
-            st.text_area("Log output", value="\n".join(log_lines), height=300, disabled=True, label_visibility="collapsed")
+                st.subheader("📋 Log")
+                running = get_running_stage()
+                log_stage = running or "stage4"
+                log_lines = read_log_tail(log_stage, lines=30)
+                st.text_area("Log output", value="\n".join(log_lines), height=300, disabled=True, label_visibility="collapsed")
 
-            if is_any_running():
-                import time
+                # The stage finished between ticks: rerun the whole page once
+                # so the launch buttons are enabled again.
+                if live and running is None:
+                    st.rerun()
 
-                time.sleep(1.5)
-                st.rerun()
+            _live_panel()
     except Exception as exc:
         logger.warning("Failed to render control page: %s", exc)
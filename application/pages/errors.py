@@ -10,6 +10,13 @@ sys.path.insert(0, str(ROOT))
 
 logger = logging.getLogger(__name__)
 
+MISSING_PHASE = {
+    "DISCOVERED": "Extração de Contrato",
+    "EXTRACTED": "Extração de Publicação",
+    "PUB_FOUND": "Pré-processamento",
+    "PREPROCESSED": "Análise de Conformidade",
+}
+
 
 def render() -> None:
     try:
@@ -37,6 +44,26 @@ def render() -> None:
         }
         tabs = st.tabs([f"{label} ({len(errors.get(key, []))})" for key, label in stage_labels.items()])
 
+        # One frame for every stage, split once; read_errors already
+        # normalises each entry to processo_id / error / at.
+        # Built column-wise: one list per column rather than a dict per error.
+        error_pairs = [
+            (stage_key, err)
+            for stage_key, errs in (errors.items() if isinstance(errors, dict) else [])
+            for err in errs
+        ]
+        all_errors = pd.DataFrame(
+            {
+                "stage": [stage_key for stage_key, _err in error_pairs],
+                "processo_id": [err.get("processo_id") for _stage, err in error_pairs],
+                "error": [err.get("error") for _stage, err in error_pairs],
+                "at": [err.get("at") for _stage, err in error_pairs],
+            },
+            columns=["stage", "processo_id", "error", "at"],
+        ).astype({"stage": "category"})
+        # Categorical stage: the split groups on integer codes, not strings.
+        error_frames = dict(tuple(all_errors.groupby("stage", sort=False, observed=True)))
+
         for tab, (stage_key, label) in zip(tabs, stage_labels.items()):
             with tab:
                 errs = errors.get(stage_key, []) if isinstance(errors, dict) else []
@@ -44,16 +71,32 @@ def render() -> None:
                     st.success("Nenhum erro nesta etapa.")
                     continue
 
-                df = pd.DataFrame(errs)
-                col_order = [col for col in ["processo_id", "error", "at"] if col in df.columns]
-                st.dataframe(df[col_order], use_container_width=True, hide_index=True)
-
-                for index, err in enumerate(errs[:20]):
-                    pid = str((err or {}).get("processo_id", "")) if isinstance(err, dict) else ""
-                    btn_label = f"↺ Reprocessar {pid}"
-                    if st.button(btn_label, key=f"retry_{stage_key}_{pid}_{index}", disabled=is_any_running()):
-                        launch_stage(stage_key, pid_filter=pid, rerun_failed=False)
-                        st.info(f"Reprocessando {pid}...")
+                st.dataframe(
+                    error_frames[stage_key],
+                    use_container_width=True,
+                    hide_index=True,
+                    column_order=("processo_id", "error", "at"),
+                )
+
+                # One selector + one button per stage instead of a button per
+                # failed PID, so the widget count no longer grows with errors.
+                # Options come from the already-split frame: one hashed
+                # unique() over the column, order of first appearance kept.
+                stage_pids = error_frames[stage_key]["processo_id"]
+                failed_pids = stage_pids[stage_pids != ""].unique().tolist()
+                if failed_pids:
+                    pick_col, retry_col = st.columns([3, 1])
+                    with pick_col:
+                        pid = st.selectbox(
+                            "Processo com erro",
+                            failed_pids,
+                            key=f"retry_pid_{stage_key}",
+                            label_visibility="collapsed",
+                        )
+                    with retry_col:
+                        if st.button(f"↺ Reprocessar {pid}", key=f"retry_{stage_key}", disabled=is_any_running()):
+                            launch_stage(stage_key, pid_filter=pid, rerun_failed=False)
+                            st.info(f"Reprocessando {pid}...")
 
                 if st.button(
                     f"↺ Reprocessar todos — {label}",
@@ -68,41 +111,42 @@ def render() -> None:
         index = read_state_index()
         contracts = index.get("contracts", {}) if isinstance(index, dict) else {}
         incomplete = [
-            {
-                "processo_id": str(meta.get("processo_id", pid_safe)),
-                "pipeline_stage": str(meta.get("pipeline_stage", "")),
-                "fase_faltante": {
-                    "DISCOVERED": "Extração de Contrato",
-                    "EXTRACTED": "Extração de Publicação",
-                    "PUB_FOUND": "Pré-processamento",
-                    "PREPROCESSED": "Análise de Conformidade",
-                }.get(str(meta.get("pipeline_stage", "")), ""),
-            }
+            (str(meta.get("processo_id", pid_safe)), str(meta.get("pipeline_stage", "")))
             for pid_safe, meta in contracts.items()
             if isinstance(meta, dict) and meta.get("pipeline_stage") not in ("SCORED", "COMPLIANCE")
         ]
 
         if incomplete:
-            st.dataframe(pd.DataFrame(incomplete), use_container_width=True, hide_index=True)
+            stages = [stage for _pid, stage in incomplete]
+            incomplete_df = pd.DataFrame(
+                {
+                    "processo_id": [pid for pid, _stage in incomplete],
+                    "pipeline_stage": stages,
+                    "fase_faltante": [MISSING_PHASE.get(stage, "") for stage in stages],
+                },
+                columns=["processo_id", "pipeline_stage", "fase_faltante"],
+            ).astype({"pipeline_stage": "category", "fase_faltante": "category"})
+            st.dataframe(incomplete_df, use_container_width=True, hide_index=True)
         else:
             st.success("Todos os contratos chegaram à etapa de análise.")
 
         if total_errors > 0:
-            buf = io.StringIO()
-            writer = csv.DictWriter(buf, fieldnames=["stage", "processo_id", "error", "at"])
-            writer.writeheader()
-            for stage_key in stage_labels:
-                for err in errors.get(stage_key, []) if isinstance(errors, dict) else []:
-                    row = {
-                        "stage": stage_key,
-                        "processo_id": str((err or {}).get("processo_id", "")) if isinstance(err, dict) else "",
-                        "error": str((err or {}).get("error", "")) if isinstance(err, dict) else "",
-                        "at": str((err or {}).get("at", "")) if isinstance(err, dict) else "",
-                    }
-                    writer.writerow(row)
+            def _errors_csv() -> bytes:
+                # error_pairs is already normalised by read_errors (string
+                # fields, stage order), so rows are written as-is.
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                writer.writerow(["stage", "processo_id", "error", "at"])
+                writer.writerows(
+                    (stage_key, err.get("processo_id", ""), err.get("error", ""), err.get("at", ""))
+                    for stage_key, err in error_pairs
+                )
+                return buf.getvalue().encode("utf-8-sig")
+
+            # Built on click, not on every rerun of the page.
             st.download_button(
                 "⬇ Exportar lista de erros (CSV)",
-                data=buf.getvalue().encode("utf-8-sig"),
+                data=_errors_csv,
                 file_name="erros_pipeline.csv",
                 mime="text/csv",
             )
@@ -9,6 +9,17 @@ sys.path.insert(0, str(ROOT))
 
 logger = logging.getLogger(__name__)
 
+# Stage that produces each explorer tab's data.
+SOURCE_STAGE = {
+    "raw": 2,
+    "pub_raw": 3,
+    "preprocessed": 3,
+    "pub_structured": 3,
+    "compliance": 4,
+    "conformity": 5,
+    "alert": 6,
+}
+
 
 def render() -> None:
     try:
@@ -46,8 +57,10 @@ def render() -> None:
 
         status = str(contract_meta.get("pipeline_stage", "DISCOVERED")) if isinstance(contract_meta, dict) else "DISCOVERED"
         conformity_data = detail.get("conformity") if isinstance(detail, dict) else None
-        score = f"{float(conformity_data.get('conformity_score', 0) or 0):.1f}" if isinstance(conformity_data, dict) else "—"
-        overall = str(conformity_data.get("overall_status", "—")) if isinstance(conformity_data, dict) else "—"
+        score = overall = "—"
+        if isinstance(conformity_data, dict):
+            score = f"{float(conformity_data.get('conformity_score', 0) or 0):.1f}"
+            overall = str(conformity_data.get("overall_status", "—"))
 
         st.markdown(
             f"**{pid_to_load}** &nbsp;|&nbsp; Etapa: `{status}` &nbsp;|&nbsp; "
@@ -67,19 +80,13 @@ def render() -> None:
         ]
 
         tabs = st.tabs([item[0] for item in tab_map])
+        if not isinstance(detail, dict):
+            detail = {}
         for tab, (_label, key) in zip(tabs, tab_map):
             with tab:
-                data = detail.get(key) if isinstance(detail, dict) else None
+                data = detail.get(key)
                 if data is None:
-                    stage_num = {
-                        "raw": 2,
-                        "pub_raw": 3,
-                        "preprocessed": 3,
-                        "pub_structured": 3,
-                        "compliance": 4,
-                        "conformity": 5,
-                        "alert": 6,
-                    }.get(key, "?")
+                    stage_num = SOURCE_STAGE.get(key, "?")
                     st.info(f"Dados não disponíveis — execute o Stage {stage_num} primeiro.")
                 else:
                     if isinstance(data, dict) and "raw_text" in data and isinstance(data["raw_text"], str):
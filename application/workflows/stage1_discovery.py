@@ -3,6 +3,7 @@ Stage 1 Discovery Workflow.
 Orchestrates the complete discovery process from ContasRio portal.
 """
 import logging
+import traceback
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
@@ -60,7 +61,11 @@ class Stage1DiscoveryWorkflow:
         try:
             # Step 1: Initialize WebDriver
             logger.info("\n📋 Step 1: Initializing WebDriver...")
-            self.driver = create_driver(headless=self.headless, anti_detection=True)
+            # ContasRio has no CAPTCHA and only text grids — skip images even
+            # when the browser is visible.
+            self.driver = create_driver(
+                headless=self.headless, anti_detection=True, load_images=False
+            )
             
             if not self.driver:
                 error_msg = "Failed to initialize WebDriver"
@@ -125,7 +130,6 @@ class Stage1DiscoveryWorkflow:
             result.add_error(error_msg)
             
             # Log stack trace for debugging
-            import traceback
             logger.error(traceback.format_exc())
         
         finally:
@@ -151,6 +155,7 @@ class Stage1DiscoveryWorkflow:
             List of unique CompanyData objects
         """
         companies_dict = {}
+        discovered_at = datetime.now().isoformat()
         
         for processo in processos:
             if not processo.company_name:
@@ -166,7 +171,8 @@ class Stage1DiscoveryWorkflow:
                     company_name=processo.company_name,
                     company_cnpj=processo.company_cnpj,
                     total_contracts=1,
-                    total_value=processo.contract_value
+                    total_value=processo.contract_value,
+                    discovered_at=discovered_at,
                 )
             else:
                 # Increment contract count
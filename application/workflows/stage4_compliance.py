@@ -26,13 +26,16 @@ Entry points
     python application/workflows/stage4_compliance.py --pid FIL-PRO-2023/00482
     python application/workflows/stage4_compliance.py --dry-run
     python application/workflows/stage4_compliance.py --rerun-failed
+    python application/workflows/stage4_compliance.py --workers 4
 """
 
 import argparse
 import json
 import logging
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -69,6 +72,12 @@ COMPLIANCE_DIR    = Path("data/compliance")
 PROGRESS_FILE     = Path("data/compliance_progress.json")
 DISCOVERY_FILE    = Path("data/discovery/processo_links.json")
 
+# PIDs evaluated concurrently (override via the COMPLIANCE_WORKERS environment
+# variable or --workers). Each PID spends most of its time waiting on Groq;
+# GroqClient is safe to share and handles 429s with its own backoff, but the
+# default stays sequential so a run cannot exceed a low Groq rate limit.
+COMPLIANCE_WORKERS: int = max(1, int(os.getenv("COMPLIANCE_WORKERS", "1")))
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # PID UTILITIES
@@ -280,6 +289,7 @@ def _extract_publication_det_fields(pub_structured: dict, preprocessed: dict) ->
 # ══════════════════════════════════════════════════════════════════════════════
 
 def _run_extraction_diagnostic(
+    pid:               str,
     groq:              GroqClient,
     raw_contract_text: str,
     raw_pub_text:      str,
@@ -310,12 +320,12 @@ def _run_extraction_diagnostic(
             contract_diag = compare_extractions(
                 det_contract, llm_contract, build_default_field_map()
             )
-            logger.info("  Contract diagnostic: %s", contract_diag.agreement_level)
+            logger.info("  [%s] Contract diagnostic: %s", pid, contract_diag.agreement_level)
         except (json.JSONDecodeError, Exception) as e:
-            logger.warning("  Contract diagnostic parse error: %s", e)
+            logger.warning("  [%s] Contract diagnostic parse error: %s", pid, e)
             warnings.append(f"diagnostic:contract_llm_parse_error:{e}")
     else:
-        logger.warning("  Contract diagnostic: LLM call returned None")
+        logger.warning("  [%s] Contract diagnostic: LLM call returned None", pid)
         warnings.append("diagnostic:contract_llm_unavailable")
 
     # ── Prompt B: publication extraction ──────────────────────────────────────
@@ -328,12 +338,12 @@ def _run_extraction_diagnostic(
             pub_diag = compare_extractions(
                 det_publication, llm_publication, build_publication_field_map()
             )
-            logger.info("  Publication diagnostic: %s", pub_diag.agreement_level)
+            logger.info("  [%s] Publication diagnostic: %s", pid, pub_diag.agreement_level)
         except (json.JSONDecodeError, Exception) as e:
-            logger.warning("  Publication diagnostic parse error: %s", e)
+            logger.warning("  [%s] Publication diagnostic parse error: %s", pid, e)
             warnings.append(f"diagnostic:publication_llm_parse_error:{e}")
     else:
-        logger.warning("  Publication diagnostic: LLM call returned None")
+        logger.warning("  [%s] Publication diagnostic: LLM call returned None", pid)
         warnings.append("diagnostic:publication_llm_unavailable")
 
     # ── Combine divergent fields from both diagnostics ─────────────────────────
@@ -447,7 +457,8 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
     warnings:list = []
     safe_pid     = _sanitize(pid)
 
-    logger.info("─" * 60)
+    # With several workers these lines interleave, so each carries the PID.
+    logger.info("%s %s", "─" * 60, pid)
     logger.info("Processing: %s", pid)
 
     # ── Step 2: Load contract preprocessed ────────────────────────────────────
@@ -462,7 +473,7 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
     pub_source     = pub_structured.get("source") if pub_structured else None
 
     if pub_structured is None:
-        logger.warning("  No publication file — writing INCONCLUSIVE")
+        logger.warning("  [%s] No publication file — writing INCONCLUSIVE", pid)
         return _write_inconclusive_no_publication(
             pid, preprocessed, t_start, warnings
         )
@@ -481,7 +492,7 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
     if raw_contract_text and raw_pub_text:
         # ── Step 5: Extraction diagnostic ──────────────────────────────────────
         contract_diag, pub_diag, combined_divergent = _run_extraction_diagnostic(
-            groq, raw_contract_text, raw_pub_text,
+            pid, groq, raw_contract_text, raw_pub_text,
             det_contract, det_publication, warnings,
         )
         api_calls += 2  # Prompt A + Prompt B
@@ -490,7 +501,7 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
         missing = []
         if not raw_contract_text: missing.append("raw_contract")
         if not raw_pub_text:      missing.append("raw_publication")
-        logger.warning("  Diagnostic skipped — missing raw files: %s", missing)
+        logger.warning("  [%s] Diagnostic skipped — missing raw files: %s", pid, missing)
         warnings.append(f"diagnostic:skipped:missing_raw_files:{','.join(missing)}")
 
     diagnostic_block = _merge_diagnostics(contract_diag, pub_diag)
@@ -503,7 +514,7 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
         publication_date=det_publication.get("publication_date"),
         diagnostic_divergent_fields=combined_divergent,
     )
-    logger.info("  R001: %s  (delta=%s days)", r001.verdict, r001.days_delta)
+    logger.info("  [%s] R001: %s  (delta=%s days)", pid, r001.verdict, r001.days_delta)
 
     # Handle embedded publication date proxy warning
     if pub_source == "embedded" and not pub_structured.get("publication_date"):
@@ -546,7 +557,7 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
         llm_response=r002_llm_response,
         diagnostic_divergent_fields=combined_divergent,
     )
-    logger.info("  R002: %s  (confidence=%s)", r002.verdict, r002.confidence)
+    logger.info("  [%s] R002: %s  (confidence=%s)", pid, r002.verdict, r002.confidence)
 
     # ── Step 8: Overall status ────────────────────────────────────────────────
     overall_status, overall_review, review_reason = _compute_overall(
@@ -605,7 +616,7 @@ def process_pid(pid: str, groq: GroqClient) -> dict:
 
     # ── Step 9: Write output ───────────────────────────────────────────────────
     _write_compliance_json(pid, result)
-    logger.info("  Overall: %s  (%.1fs, %d API calls)", overall_status, elapsed, api_calls)
+    logger.info("  [%s] Overall: %s  (%.1fs, %d API calls)", pid, overall_status, elapsed, api_calls)
     return result
 
 
@@ -688,6 +699,7 @@ def run_stage4_compliance(
     pid_filter: str | None = None,
     dry_run:    bool       = False,
     rerun_failed: bool     = False,
+    workers:    int | None = None,
 ) -> dict:
     """
     Main entry point for Stage 4 compliance evaluation.
@@ -696,6 +708,7 @@ def run_stage4_compliance(
         pid_filter:   If set, process only this PID.
         dry_run:      Print plan, exit without making any API calls or writes.
         rerun_failed: Also reprocess PIDs that previously failed.
+        workers:      PIDs evaluated concurrently; defaults to COMPLIANCE_WORKERS.
 
     Returns:
         Summary dict with counts.
@@ -743,6 +756,7 @@ def run_stage4_compliance(
     # ── Process PIDs ──────────────────────────────────────────────────────────
     results = {"total": len(all_pids), "completed": 0, "failed": 0, "skipped": 0}
 
+    pending: list[tuple[str, str]] = []
     for i, pid in enumerate(all_pids, 1):
         label = f"[{i}/{len(all_pids)}] {pid}"
 
@@ -753,28 +767,40 @@ def run_stage4_compliance(
                 results["skipped"] += 1
                 continue
 
-        logger.info("Processing %s", label)
+        pending.append((label, pid))
 
+    def _evaluate(item: tuple[str, str]) -> Exception | None:
+        label, pid = item
+        logger.info("Processing %s", label)
         try:
             process_pid(pid, groq)
-            _mark_completed(progress, pid)
-            results["completed"] += 1
-
-        except FileNotFoundError as e:
-            logger.error("  Skipped — %s", e)
-            _mark_skipped(progress, pid)
-            results["skipped"] += 1
-
+            return None
         except Exception as e:
-            logger.error("  FAILED — %s", e, exc_info=True)
-            _mark_failed(progress, pid, str(e))
-            append_failed_item(
-                processo_id=pid,
-                stage="stage4",
-                error_type="ExtractionFailedError",
-                error_msg=str(e),
-            )
-            results["failed"] += 1
+            return e
+
+    # PIDs run on worker threads; progress and failure bookkeeping stay on
+    # this thread, in discovery order, as results come back.
+    with ThreadPoolExecutor(max_workers=max(1, workers or COMPLIANCE_WORKERS)) as pool:
+        for (_label, pid), error in zip(pending, pool.map(_evaluate, pending)):
+            if error is None:
+                _mark_completed(progress, pid)
+                results["completed"] += 1
+
+            elif isinstance(error, FileNotFoundError):
+                logger.error("  [%s] Skipped — %s", pid, error)
+                _mark_skipped(progress, pid)
+                results["skipped"] += 1
+
+            else:
+                logger.error("  [%s] FAILED — %s", pid, error, exc_info=error)
+                _mark_failed(progress, pid, str(error))
+                append_failed_item(
+                    processo_id=pid,
+                    stage="stage4",
+                    error_type="ExtractionFailedError",
+                    error_msg=str(error),
+                )
+                results["failed"] += 1
 
     # ── Final summary ──────────────────────────────────────────────────────────
     logger.info("═" * 60)
@@ -808,6 +834,10 @@ def main():
         "--rerun-failed", action="store_true",
         help="Reprocess PIDs that previously failed",
     )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="PIDs evaluated concurrently (default: COMPLIANCE_WORKERS env var, else 1)",
+    )
     parser.add_argument(
         "--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         default="INFO",
@@ -853,6 +883,7 @@ def main():
         pid_filter=args.pid,
         dry_run=args.dry_run,
         rerun_failed=args.rerun_failed,
+        workers=args.workers,
     )
 
     if not args.dry_run:
@@ -7,10 +7,11 @@ Stage 5 — Conformity Scoring & Reporting Engine.
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
@@ -21,6 +22,7 @@ from infrastructure.io.conformity_writer import (
     write_conformity_summary,
 )
 from infrastructure.io.csv_exporter import write_conformity_csv
+from infrastructure.persistence import json_codec
 from infrastructure.logging_config import setup_logging, add_error_log_file
 from infrastructure.health_check import run_preflight
 
@@ -32,12 +34,17 @@ CONFORMITY_DIR = BASE_DIR / "data" / "conformity"
 SUMMARY_PATH = BASE_DIR / "data" / "conformity_summary.json"
 CSV_PATH = BASE_DIR / "data" / "conformity_export.csv"
 
+# Threads used to read compliance + fallback JSONs ahead of scoring
+LOAD_WORKERS = 8
+# Most contracts loaded but not yet scored at any one time
+LOAD_AHEAD = 2 * LOAD_WORKERS
+
 
 def _load_json(path: Path) -> dict | None:
     if not path or not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_codec.loads(path.read_bytes())
     except Exception as exc:
         logger.warning("Failed to load JSON %s: %s", path, exc)
         return None
@@ -55,6 +62,27 @@ def _resolve_fallback_sources(compliance_json: dict) -> tuple[dict | None, dict
     return contract_data, publication_data, used
 
 
+def _load_inputs(file_path: Path) -> tuple[dict | None, dict | None, dict | None, bool]:
+    compliance_json = _load_json(file_path)
+    if not compliance_json:
+        return None, None, None, False
+    contract_data, publication_data, used = _resolve_fallback_sources(compliance_json)
+    return compliance_json, contract_data, publication_data, used
+
+
+def _iter_loaded_inputs(pool: ThreadPoolExecutor, files: list[Path]):
+    # Sliding window over the files: at most LOAD_AHEAD loads are queued or
+    # held, so parsed inputs cannot pile up in memory when scoring is the
+    # slower side. Results come back in file order.
+    pending: deque[Future] = deque()
+    for file_path in files:
+        pending.append(pool.submit(_load_inputs, file_path))
+        if len(pending) >= LOAD_AHEAD:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
 def _build_csv_row(result: dict) -> dict:
     flags = "|".join(result.get("flags", []))
     breakdown = result.get("score_breakdown", {})
@@ -112,10 +140,14 @@ def run_stage5_conformity(pid: str | None = None) -> dict:
             "processing_time_seconds": round(time.monotonic() - t_start, 2),
         }
 
-    files = sorted(COMPLIANCE_DIR.glob("*_compliance.json"))
     if pid:
+        # Single-contract runs go straight to the file instead of listing
+        # the whole directory and scanning it for one name.
         safe_pid = pid.replace("/", "_").replace("\\", "_")
-        files = [f for f in files if f.name == f"{safe_pid}_compliance.json"]
+        target = COMPLIANCE_DIR / f"{safe_pid}_compliance.json"
+        files = [target] if target.is_file() else []
+    else:
+        files = sorted(COMPLIANCE_DIR.glob("*_compliance.json"))
 
     logger.info("Stage 5 starting with %d compliance file(s).", len(files))
 
@@ -132,45 +164,45 @@ def run_stage5_conformity(pid: str | None = None) -> dict:
 
     score_sum = 0.0
     fallback_usage = 0
-
-    for file_path in files:
-        compliance_json = _load_json(file_path)
-        if not compliance_json:
-            continue
-
-        contract_data, publication_data, used_fallback = _resolve_fallback_sources(compliance_json)
-        if used_fallback:
-            fallback_usage += 1
-            logger.info("Fallback source loaded for %s", compliance_json.get("processo_id"))
-
-        result = compute_conformity(
-            compliance_json,
-            contract_preprocessed=contract_data,
-            publication_structured=publication_data,
-        )
-
-        write_conformity_result(result.get("processo_id", "UNKNOWN"), result, CONFORMITY_DIR)
-        csv_rows.append(_build_csv_row(result))
-
-        summary["total_contracts"] += 1
-        status = result.get("overall_status")
-        if status == "CONFORME":
-            summary["conformes"] += 1
-        elif status == "PARCIAL":
-            summary["parciais"] += 1
-        elif status == "NÃO CONFORME":
-            summary["nao_conformes"] += 1
-        else:
-            summary["incomplete"] += 1
-
-        if result.get("flags"):
-            summary["flagged_count"] += 1
-        score_sum += float(result.get("conformity_score", 0.0))
-
-        if result.get("diagnostic", {}).get("agreement_level") == "DIVERGENT":
-            logger.warning("Diagnostic divergence for %s", result.get("processo_id"))
-        if "MISSING_PUBLICATION" in result.get("flags", []):
-            logger.warning("Missing publication case for %s", result.get("processo_id"))
+    status_counts: Counter[str] = Counter()
+
+    # Loading inputs is pure file I/O and independent per contract, so it is
+    # read ahead on a thread pool, a bounded window at a time. Scoring and
+    # writing stay sequential so the summary, CSV and logs keep file order.
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+        for compliance_json, contract_data, publication_data, used_fallback in _iter_loaded_inputs(pool, files):
+            if not compliance_json:
+                continue
+
+            if used_fallback:
+                fallback_usage += 1
+                logger.info("Fallback source loaded for %s", compliance_json.get("processo_id"))
+
+            result = compute_conformity(
+                compliance_json,
+                contract_preprocessed=contract_data,
+                publication_structured=publication_data,
+            )
+
+            write_conformity_result(result.get("processo_id", "UNKNOWN"), result, CONFORMITY_DIR)
+            csv_rows.append(_build_csv_row(result))
+
+            status_counts[result.get("overall_status")] += 1
+
+            if result.get("flags"):
+                summary["flagged_count"] += 1
+            score_sum += float(result.get("conformity_score", 0.0))
+
+            if result.get("diagnostic", {}).get("agreement_level") == "DIVERGENT":
+                logger.warning("Diagnostic divergence for %s", result.get("processo_id"))
+            if "MISSING_PUBLICATION" in result.get("flags", []):
+                logger.warning("Missing publication case for %s", result.get("processo_id"))
+
+    summary["total_contracts"] = status_counts.total()
+    summary["conformes"] = status_counts.pop("CONFORME", 0)
+    summary["parciais"] = status_counts.pop("PARCIAL", 0)
+    summary["nao_conformes"] = status_counts.pop("NÃO CONFORME", 0)
+    summary["incomplete"] = status_counts.total()
 
     if summary["total_contracts"]:
         summary["average_score"] = round(score_sum / summary["total_contracts"], 2)
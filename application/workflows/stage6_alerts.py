@@ -7,7 +7,6 @@ Stage 6 — Deterministic alert generation from Stage 5 conformity outputs.
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 import time
@@ -25,6 +24,7 @@ from infrastructure.io.alert_exporter import (
     write_alerts_xlsx,
 )
 from infrastructure.io.alert_writer import write_alert_result, write_alert_summary
+from infrastructure.persistence import json_codec
 from infrastructure.logging_config import setup_logging, add_error_log_file
 from infrastructure.health_check import run_preflight
 
@@ -40,7 +40,7 @@ def _load_json(path: Path) -> dict | None:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_codec.loads(path.read_bytes())
     except Exception as exc:
         logger.warning("Failed to load JSON %s: %s", path, exc)
         return None
@@ -69,10 +69,13 @@ def run_stage6_alerts(pid: str | None = None) -> dict:
             "preflight_errors": preflight.errors,
         }
 
-    files = sorted(CONFORMITY_DIR.glob("*_conformity.json")) if CONFORMITY_DIR.exists() else []
     if pid:
+        # One known file name: stat it rather than glob the directory.
         safe_pid = pid.replace("/", "_").replace("\\", "_")
-        files = [f for f in files if f.name == f"{safe_pid}_conformity.json"]
+        target = CONFORMITY_DIR / f"{safe_pid}_conformity.json"
+        files = [target] if target.is_file() else []
+    else:
+        files = sorted(CONFORMITY_DIR.glob("*_conformity.json")) if CONFORMITY_DIR.exists() else []
 
     logger.info("Stage 6 starting with %d conformity file(s).", len(files))
 
@@ -9,13 +9,17 @@ ProcessoLink holds ONLY what is discoverable during navigation —
 the processo number and its URL on processo.rio.
 Contract content (objeto, situação, datas, valores) is Stage 2 work
 and belongs in a separate extraction model.
+
+ProcessoLink and CompanyData use __slots__: a discovery run creates one
+instance per grid row, so dropping the per-instance __dict__ keeps them
+small.
 """
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessoLink:
     """
     One contract link discovered during ContasRio navigation.
@@ -61,7 +65,7 @@ class ProcessoLink:
         return f"ProcessoLink({self.processo_id} | {self.company_name})"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyData:
     """
     One Favorecido row from the ContasRio all-companies grid.
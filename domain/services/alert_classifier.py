@@ -5,6 +5,10 @@ Deterministic Stage 6 alert classification from Stage 5 conformity results.
 from __future__ import annotations
 
 from datetime import datetime
+from types import MappingProxyType
+
+# Shared read-only default for nested lookups — no fresh {} per miss.
+_EMPTY = MappingProxyType({})
 
 
 def _has_flag(conformity_json: dict, flag: str) -> bool:
@@ -18,7 +22,7 @@ def _collect_failed_rules(conformity_json: dict) -> list[str]:
     if not isinstance(score_breakdown, dict):
         return failed
     for rule_name in ("R001", "R002", "R003", "R004"):
-        verdict = str(score_breakdown.get(rule_name, {}).get("verdict", "")).upper()
+        verdict = str(score_breakdown.get(rule_name, _EMPTY).get("verdict", "")).upper()
         if verdict == "FAIL":
             failed.append(rule_name)
     return failed
@@ -34,27 +38,26 @@ def _build_reason_details(
         "failed_rules": failed_rules,
         "recommendations": conformity_json.get("recommendations", []),
     }
+    compliance = compliance_json or _EMPTY
 
     if reason == "MISSING_PUBLICATION":
         details["action"] = "extract_publication"
         details["evidence"] = str(
-            (compliance_json or {}).get("overall", {}).get("review_reason", "no_publication_found")
+            compliance.get("overall", _EMPTY).get("review_reason", "no_publication_found")
         )
     elif reason == "DIAGNOSTIC_DIVERGENCE":
         details["action"] = "manual_audit"
-        details["evidence"] = (compliance_json or {}).get("extraction_diagnostic", {}).get(
-            "divergence_detail", {}
-        )
+        details["evidence"] = compliance.get("extraction_diagnostic", _EMPTY).get("divergence_detail", {})
     elif reason == "NON_CONFORME":
         details["action"] = "investigate_rule_failures"
         details["evidence"] = {
-            "r001": (compliance_json or {}).get("r001_timeliness", {}).get("verdict"),
-            "r002": (compliance_json or {}).get("r002_party_match", {}).get("verdict"),
+            "r001": compliance.get("r001_timeliness", _EMPTY).get("verdict"),
+            "r002": compliance.get("r002_party_match", _EMPTY).get("verdict"),
         }
     elif reason == "NEEDS_REVIEW":
         details["action"] = "review_before_approval"
         details["evidence"] = {
-            "agreement_level": conformity_json.get("diagnostic", {}).get("agreement_level"),
+            "agreement_level": conformity_json.get("diagnostic", _EMPTY).get("agreement_level"),
             "requires_review": bool(conformity_json.get("requires_review", False)),
         }
     else:
@@ -13,14 +13,17 @@ def _percent(count: int, total: int) -> float:
 
 def build_alert_executive_summary(alerts: list[dict]) -> dict:
     total = len(alerts)
-    ok = sum(1 for a in alerts if a.get("alert_level") == "OK")
-    review = sum(1 for a in alerts if a.get("alert_level") == "REVIEW")
-    failed = sum(1 for a in alerts if a.get("alert_level") == "FAILED")
+    level_counts: dict[str, int] = {"OK": 0, "REVIEW": 0, "FAILED": 0}
 
     by_reason: dict[str, int] = {}
     failed_rules: dict[str, int] = {"R001": 0, "R002": 0, "R003": 0, "R004": 0}
 
+    # Single pass: level, reason and rule counts together.
     for alert in alerts:
+        level = alert.get("alert_level")
+        if level in level_counts:
+            level_counts[level] += 1
+
         reason = str(alert.get("reason", "UNKNOWN"))
         by_reason[reason] = by_reason.get(reason, 0) + 1
 
@@ -28,6 +31,10 @@ def build_alert_executive_summary(alerts: list[dict]) -> dict:
             if rule in failed_rules:
                 failed_rules[rule] += 1
 
+    ok = level_counts["OK"]
+    review = level_counts["REVIEW"]
+    failed = level_counts["FAILED"]
+
     return {
         "generated_at": datetime.now().isoformat(),
         "total_contracts": total,
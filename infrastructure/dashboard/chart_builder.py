@@ -60,12 +60,14 @@ def render_pipeline_progress_bars(state_index: dict) -> None:
         for key, label in stage_labels.items():
             s = get_stage_status(key)
             pct = float((s.get("progress_pct", 0.0) if isinstance(s, dict) else 0.0) or 0.0) / 100
-            st.write(
-                f"**{label}** — {str(s.get('status', '') if isinstance(s, dict) else '')} "
-                f"({int(s.get('completed', 0) if isinstance(s, dict) else 0)}/"
-                f"{int(s.get('total', 0) if isinstance(s, dict) else 0)})"
+            st.progress(
+                pct,
+                text=(
+                    f"**{label}** — {str(s.get('status', '') if isinstance(s, dict) else '')} "
+                    f"({int(s.get('completed', 0) if isinstance(s, dict) else 0)}/"
+                    f"{int(s.get('total', 0) if isinstance(s, dict) else 0)})"
+                ),
             )
-            st.progress(pct)
     except Exception as exc:
         logger.warning("Failed to render pipeline progress bars: %s", exc)
 
@@ -98,11 +100,15 @@ def render_coverage_metrics(coverage: dict) -> None:
     try:
         import streamlit as st
 
-        c1, c2, c3, c4 = st.columns(4)
-        c1.metric("Descobertos", coverage.get("total_discovered", 0) if isinstance(coverage, dict) else 0)
-        c2.metric("Extraídos", coverage.get("total_extracted", 0) if isinstance(coverage, dict) else 0)
-        c3.metric("Publicações", coverage.get("total_pub_found", 0) if isinstance(coverage, dict) else 0)
-        c4.metric("Analisados", coverage.get("total_analyzed", 0) if isinstance(coverage, dict) else 0)
+        if not isinstance(coverage, dict):
+            coverage = {}
+        # One markdown element instead of a four-column layout of metric widgets.
+        st.markdown(
+            f"**Descobertos** {coverage.get('total_discovered', 0)} · "
+            f"**Extraídos** {coverage.get('total_extracted', 0)} · "
+            f"**Publicações** {coverage.get('total_pub_found', 0)} · "
+            f"**Analisados** {coverage.get('total_analyzed', 0)}"
+        )
     except Exception as exc:
         logger.warning("Failed to render coverage metrics: %s", exc)
 
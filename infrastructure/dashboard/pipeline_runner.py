@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import glob
 import json
 import logging
@@ -12,10 +13,6 @@ from pathlib import Path
 from typing import Any
 
 from config.settings import DATA_DIR, OUTPUTS_DIR
-from application.workflows.stage4_compliance import run_stage4_compliance
-from application.workflows.stage5_conformity import run_stage5_conformity
-from application.workflows.stage6_alerts import run_stage6_alerts
-from application.workflows.stage6_report import run_stage6_report
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +113,26 @@ def _parse_stage_progress(stage_name: str, data: dict) -> tuple[int, int, int]:
         return 0, 0, 0
 
 
+@functools.lru_cache(maxsize=16)
+def _read_progress(
+    stage_name: str, path: str, mtime_ns: int, size: int
+) -> tuple[int, int, int, str | None] | None:
+    # Keyed by (mtime, size): the sidebar polls every stage on each Streamlit
+    # rerun, but a progress file only needs re-parsing after it is rewritten.
+    # Only the counters are kept, not the parsed document.
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+    total, completed, failed_count = _parse_stage_progress(stage_name, data if isinstance(data, dict) else {})
+
+    last_run = None
+    if isinstance(data, dict):
+        last_run = data.get("updated_at") or data.get("built_at") or data.get("generated_at") or None
+    return total, completed, failed_count, last_run
+
+
 def get_stage_status(stage_name: str) -> dict:
     base = {
         "stage": stage_name,
@@ -144,19 +161,18 @@ def get_stage_status(stage_name: str) -> dict:
             value = STAGE_PROGRESS_FILES.get(stage_name)
             progress_path = value if isinstance(value, Path) else None
 
-        if progress_path is None or not progress_path.exists():
+        if progress_path is None:
             return base
 
         try:
-            data = json.loads(progress_path.read_text(encoding="utf-8"))
-        except Exception:
+            stat = progress_path.stat()
+        except OSError:
             return base
 
-        total, completed, failed_count = _parse_stage_progress(stage_name, data if isinstance(data, dict) else {})
-
-        last_run = None
-        if isinstance(data, dict):
-            last_run = data.get("updated_at") or data.get("built_at") or data.get("generated_at") or None
+        progress = _read_progress(stage_name, str(progress_path), stat.st_mtime_ns, stat.st_size)
+        if progress is None:
+            return base
+        total, completed, failed_count, last_run = progress
 
         with _LOCK:
             running_now = _RUNNING_STAGE == stage_name
@@ -213,6 +229,14 @@ def _run_subprocess_stage(
 
 def _run_thread_stage(stage_name: str, pid_filter: str | None, rerun_failed: bool, analyst_name: str) -> None:
     try:
+        # Imported here, not at module top: the dashboard imports this module
+        # for the sidebar status on every start, and the workflows pull in
+        # the LLM client, pandas and the report writers.
+        from application.workflows.stage4_compliance import run_stage4_compliance
+        from application.workflows.stage5_conformity import run_stage5_conformity
+        from application.workflows.stage6_alerts import run_stage6_alerts
+        from application.workflows.stage6_report import run_stage6_report
+
         if stage_name == "stage4":
             run_stage4_compliance(pid_filter=pid_filter, dry_run=False, rerun_failed=rerun_failed)
         elif stage_name == "stage5":
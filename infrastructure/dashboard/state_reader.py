@@ -1,25 +1,31 @@
 from __future__ import annotations
 
 import glob
-import json
 import logging
-from collections import deque
+import os
 from datetime import datetime
 from pathlib import Path
 
 from config.settings import ALERTS_DIR, COMPLIANCE_DIR, CONFORMITY_DIR, DATA_DIR, EXTRACTIONS_DIR, LOGS_DIR, PREPROCESSED_DIR
 from domain.services.alert_queue import build_alert_queue
-from infrastructure.io.state_index_builder import STATE_INDEX_PATH, build_state_index, load_state_index, save_state_index
+from infrastructure.io.state_index_builder import (
+    STATE_INDEX_PATH,
+    build_state_index,
+    load_state_index,
+    sanitize_pid,
+    save_state_index,
+)
 from infrastructure.io.report_aggregator import build_aggregate_report
+from infrastructure.persistence import json_codec
 
 logger = logging.getLogger(__name__)
 
 
-def _cache_data(ttl: int):
+def _cache_data(ttl: int, max_entries: int | None = None):
     try:
         import streamlit as st
 
-        return st.cache_data(ttl=ttl)
+        return st.cache_data(ttl=ttl, max_entries=max_entries)
     except Exception:
         def _decorator(func):
             return func
@@ -27,18 +33,11 @@ def _cache_data(ttl: int):
         return _decorator
 
 
-def _sanitize(pid: str) -> str:
-    try:
-        return str(pid).replace("/", "_").replace("\\", "_")
-    except Exception:
-        return ""
-
-
 def _load_json(path: Path) -> dict | None:
-    if not path.exists():
-        return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_codec.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
     except Exception as exc:
         logger.warning("Could not parse %s: %s", path, exc)
         return None
@@ -83,9 +82,111 @@ def read_aggregate_report() -> dict:
         }
 
 
+def _filter_fields(contract: dict) -> tuple[str, str, float]:
+    try:
+        score = float(contract.get("conformity_score", 0) or 0)
+    except (TypeError, ValueError):
+        score = float("nan")  # falls outside every score range
+    return (
+        str(contract.get("overall_status", "INCOMPLETE")),
+        str(contract.get("company_name", "")).lower(),
+        score,
+    )
+
+
+def _status_buckets(fields: list[tuple[str, str, float]]) -> dict[str, list[int]]:
+    by_status: dict[str, list[int]] = {}
+    for idx, (status, _company, _score) in enumerate(fields):
+        by_status.setdefault(status, []).append(idx)
+    return by_status
+
+
+# (generated_at, contract count) of the last aggregate seen, with its filter
+# fields and status buckets. Replaced as one tuple, so a reader never pairs
+# one build's key with another build's fields or buckets.
+_filter_snapshot: tuple[tuple[str, int], list[tuple[str, str, float]], dict[str, list[int]]] | None = None
+
+
+def _contract_filter_index(agg: dict, contracts: list[dict]) -> tuple[list[tuple[str, str, float]], dict[str, list[int]]]:
+    # Status, lowered company name and numeric score per contract, plus the
+    # contract positions bucketed by status, derived once per aggregate
+    # rather than on every new filter combination. Both come from the same
+    # aggregate the caller filters.
+    global _filter_snapshot
+    generated_at = str(agg.get("generated_at", "") or "")
+    if not generated_at:
+        fields = [_filter_fields(contract) for contract in contracts]
+        return fields, _status_buckets(fields)
+
+    key = (generated_at, len(contracts))
+    snapshot = _filter_snapshot
+    if snapshot is None or snapshot[0] != key:
+        fields = [_filter_fields(contract) for contract in contracts]
+        snapshot = (key, fields, _status_buckets(fields))
+        _filter_snapshot = snapshot
+    return snapshot[1], snapshot[2]
+
+
+def filter_contracts(agg: dict, statuses: tuple[str, ...], company_search: str, score_min: float, score_max: float) -> list[dict]:
+    # Filters the aggregate the caller already holds. Not behind
+    # st.cache_data: a cache hit would unpickle the filtered list, which
+    # costs more than this pass over the precomputed fields.
+    try:
+        contracts = agg.get("contracts", []) if isinstance(agg, dict) else []
+        if not isinstance(contracts, list):
+            return []
+        fields, by_status = _contract_filter_index(agg, contracts)
+
+        needle = company_search.lower()
+        # Merge the selected buckets back into aggregate order.
+        indices = sorted(idx for status in set(statuses) for idx in by_status.get(status, ()))
+        return [
+            contracts[idx]
+            for idx in indices
+            if (not needle or needle in fields[idx][1]) and score_min <= fields[idx][2] <= score_max
+        ]
+    except Exception as exc:
+        logger.warning("Failed to filter contracts: %s", exc)
+        return []
+
+
+def _build_export(fmt: str, contracts: list[dict]) -> bytes:
+    try:
+        if fmt == "xlsx":
+            from infrastructure.io.excel_writer import build_excel_filtered_bytes
+
+            return build_excel_filtered_bytes(contracts)
+
+        from infrastructure.io.report_csv_writer import build_report_csv_bytes
+
+        return build_report_csv_bytes(contracts, datetime.now().isoformat())
+    except Exception as exc:
+        logger.warning("Failed to build %s export: %s", fmt, exc)
+        return b""
+
+
+@_cache_data(ttl=60, max_entries=8)
+def _cached_export(fmt: str, generated_at: str, statuses: tuple[str, ...], company_search: str, score_min: float, score_max: float, _contracts: list[dict]) -> bytes:
+    # _contracts is not hashed by st.cache_data; the key is the aggregate's
+    # generated_at plus the filter, and the rows always come from that build.
+    return _build_export(fmt, _contracts)
+
+
+def read_filtered_export(fmt: str, agg: dict, statuses: tuple[str, ...], company_search: str, score_min: float, score_max: float) -> bytes:
+    # Export bytes for the aggregate on screen and the same filter are built
+    # once; repeat downloads reuse them. An aggregate without generated_at
+    # cannot be told apart from a newer build, so its export is not cached.
+    contracts = filter_contracts(agg, statuses, company_search, score_min, score_max)
+    generated_at = str(agg.get("generated_at", "") or "")
+    if not generated_at:
+        return _build_export(fmt, contracts)
+    return _cached_export(fmt, generated_at, statuses, company_search, score_min, score_max, contracts)
+
+
+@_cache_data(ttl=30, max_entries=64)
 def read_processo_detail(pid: str) -> dict:
     try:
-        pid_safe = _sanitize(pid)
+        pid_safe = sanitize_pid(pid)
         return {
             "raw": _load_json(EXTRACTIONS_DIR / f"{pid_safe}_raw.json"),
             "pub_raw": _load_json(EXTRACTIONS_DIR / f"{pid_safe}_publications_raw.json"),
@@ -108,6 +209,7 @@ def read_processo_detail(pid: str) -> dict:
         }
 
 
+@_cache_data(ttl=30)
 def read_all_alerts() -> list[dict]:
     try:
         import domain.services.alert_queue as alert_queue
@@ -119,11 +221,7 @@ def read_all_alerts() -> list[dict]:
         if not paths:
             return []
 
-        alerts: list[dict] = []
-        for path in paths:
-            data = _load_json(path)
-            if isinstance(data, dict):
-                alerts.append(data)
+        alerts = [data for data in map(_load_json, paths) if isinstance(data, dict)]
 
         if not alerts:
             return []
@@ -143,13 +241,11 @@ def read_all_alerts() -> list[dict]:
                 ordered.append(lookup[processo_id])
                 used_ids.add(processo_id)
 
-        ok_tail: list[dict] = []
-        for alert in alerts:
-            processo_id = str(alert.get("processo_id", ""))
-            if processo_id in used_ids:
-                continue
-            if str(alert.get("alert_level", "")) == "OK":
-                ok_tail.append(alert)
+        ok_tail = [
+            alert
+            for alert in alerts
+            if str(alert.get("processo_id", "")) not in used_ids and str(alert.get("alert_level", "")) == "OK"
+        ]
 
         return ordered + ok_tail
     except Exception as exc:
@@ -157,34 +253,44 @@ def read_all_alerts() -> list[dict]:
         return []
 
 
-def read_errors() -> dict:
-    result = {"stage2": [], "stage3": [], "stage4": []}
+# Progress file (under DATA_DIR) and its failed-items key, per stage.
+_ERROR_SOURCES = {
+    "stage2": ("extraction_progress.json", "failed"),
+    "stage3": ("publication_extraction_progress.json", "failed"),
+    "stage4": ("compliance_progress.json", "failed"),
+}
+
+
+def _mtime_ns(path: Path) -> int:
     try:
-        stage_specs = {
-            "stage2": (DATA_DIR / "extraction_progress.json", "failed"),
-            "stage3": (DATA_DIR / "publication_extraction_progress.json", "failed"),
-            "stage4": (DATA_DIR / "compliance_progress.json", "failed"),
-        }
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
 
-        for stage_name, (path, failed_key) in stage_specs.items():
-            data = _load_json(path)
+@_cache_data(ttl=300, max_entries=4)
+def _read_errors(source_mtimes: tuple[int, ...]) -> dict:
+    # source_mtimes is only a cache key: any progress file being rewritten
+    # (a stage run or a retry) invalidates the entry, so it can live longer
+    # than a plain TTL without going stale.
+    result = {"stage2": [], "stage3": [], "stage4": []}
+    try:
+        for stage_name, (file_name, failed_key) in _ERROR_SOURCES.items():
+            data = _load_json(DATA_DIR / file_name)
             if not isinstance(data, dict):
                 continue
             failed = data.get(failed_key, [])
             if not isinstance(failed, list):
                 continue
 
-            normalized: list[dict] = []
-            for entry in failed:
-                item = entry if isinstance(entry, dict) else {}
-                normalized.append(
-                    {
-                        "processo_id": str(item.get("processo_id", "") or ""),
-                        "error": str(item.get("error", "") or ""),
-                        "at": str(item.get("at", "") or ""),
-                    }
-                )
-            result[stage_name] = normalized
+            result[stage_name] = [
+                {
+                    "processo_id": str(item.get("processo_id", "") or ""),
+                    "error": str(item.get("error", "") or ""),
+                    "at": str(item.get("at", "") or ""),
+                }
+                for item in (entry if isinstance(entry, dict) else {} for entry in failed)
+            ]
 
         return result
     except Exception as exc:
@@ -192,6 +298,11 @@ def read_errors() -> dict:
         return result
 
 
+def read_errors() -> dict:
+    return _read_errors(tuple(_mtime_ns(DATA_DIR / file_name) for file_name, _failed_key in _ERROR_SOURCES.values()))
+
+
+@_cache_data(ttl=30)
 def read_discovery_summary() -> dict:
     try:
         summary_path = DATA_DIR / "discovery" / "discovery_summary.json"
@@ -210,39 +321,59 @@ def read_discovery_summary() -> dict:
         return {}
 
 
+_OUTPUT_SUFFIXES = (".xlsx", ".csv", ".json")
+
+
+@_cache_data(ttl=10, max_entries=4)
+def _list_output_files(outputs_dir: str, dir_mtime_ns: int) -> list[dict]:
+    # dir_mtime_ns is only a cache key: a new or removed export changes it.
+    # One scandir pass; DirEntry.stat() is reused for both sort and display.
+    entries = [
+        (entry, entry.stat())
+        for entry in os.scandir(outputs_dir)
+        if entry.is_file() and entry.name.endswith(_OUTPUT_SUFFIXES) and not entry.name.startswith(".")
+    ]
+    entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    return [
+        {
+            "name": entry.name,
+            "path": entry.path,
+            "size_kb": round(stat.st_size / 1024, 1),
+            "modified_at": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
+        }
+        for entry, stat in entries
+    ]
+
+
 def list_output_files() -> list[dict]:
     try:
         outputs_dir = DATA_DIR / "outputs"
-        if not outputs_dir.exists():
+        try:
+            dir_mtime_ns = outputs_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
-
-        paths: list[Path] = []
-        for pattern in ("*.xlsx", "*.csv", "*.json"):
-            for raw_path in glob.glob(str(outputs_dir / pattern)):
-                paths.append(Path(raw_path))
-
-        if not paths:
-            return []
-
-        paths = sorted(paths, key=lambda p: p.stat().st_mtime, reverse=True)
-        rows: list[dict] = []
-        for path in paths:
-            stat = path.stat()
-            rows.append(
-                {
-                    "name": path.name,
-                    "path": str(path),
-                    "size_kb": round(stat.st_size / 1024, 1),
-                    "modified_at": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
-                }
-            )
-        return rows
+        return _list_output_files(str(outputs_dir), dir_mtime_ns)
     except Exception as exc:
         logger.warning("Failed to list output files: %s", exc)
         return []
 
 
-@_cache_data(ttl=5)
+def _tail_lines(path: Path, max_lines: int, block_size: int = 8192) -> list[str]:
+    # Read backwards from EOF in blocks until enough line breaks are seen, so
+    # the cost tracks the tail size rather than the (growing) log size.
+    with path.open("rb") as log_file:
+        log_file.seek(0, os.SEEK_END)
+        pos = log_file.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= max_lines:
+            step = min(block_size, pos)
+            pos -= step
+            log_file.seek(pos)
+            data = log_file.read(step) + data
+    return [line.decode("utf-8", errors="replace") for line in data.splitlines()[-max_lines:]]
+
+
+@_cache_data(ttl=5, max_entries=16)
 def read_log_tail(stage_name: str, lines: int = 50) -> list[str]:
     try:
         max_lines = int(lines) if int(lines) > 0 else 50
@@ -252,11 +383,7 @@ def read_log_tail(stage_name: str, lines: int = 50) -> list[str]:
             return []
 
         latest = max(matches, key=lambda p: p.stat().st_mtime)
-        buffer: deque[str] = deque(maxlen=max_lines)
-        with latest.open("r", encoding="utf-8") as log_file:
-            for line in log_file:
-                buffer.append(line.rstrip("\n"))
-        return list(buffer)
+        return _tail_lines(latest, max_lines)
     except Exception as exc:
         logger.warning("Failed to read log tail for '%s': %s", stage_name, exc)
         return []
@@ -116,12 +116,63 @@ _CTADA_RE = re.compile(
     r'(?:CONTRATADA|contratada)\s*[:,]\s*'
     r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n,;]{5,120})'
 )
+# Fix 3 (v7): object description runs until the next structural field
+_OBJECT_RE = re.compile(
+    r'(?:objeto\s*(?:do\s+presente)?|OBJETO)\s*[:\-]?\s*'
+    r'(.+?)'
+    r'(?=\n\s*(?:Valor|VALOR|Vig[eê]n|Prazo|PRAZO'
+    r'|Data\s+da|Par[aá]grafo\s+[Pp]rimeiro|CL[AÁ]USULA))',
+    re.IGNORECASE | re.DOTALL
+)
 _MONTHS_PT = {
     "janeiro":"01","fevereiro":"02","mar\u00e7o":"03","abril":"04",
     "maio":"05","junho":"06","julho":"07","agosto":"08",
     "setembro":"09","outubro":"10","novembro":"11","dezembro":"12",
 }
 
+# ── Party cleanup / prose fallbacks ───────────────────────────────────────────
+
+_WS_RE          = re.compile(r'\s+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_LINEBREAK_RE   = re.compile(r'\s*\n\s*')
+_INSCRITO_TAIL_RE = re.compile(r'\s*,?\s*inscrit[ao].{0,200}$', re.IGNORECASE)
+_CNPJ_TAIL_RE     = re.compile(r'\s*,?\s*CNPJ.{0,100}$',        re.IGNORECASE)
+_TRAILING_E_RE    = re.compile(r'\s+e\s*$',                     re.IGNORECASE)
+
+# Pattern 0 — "Aos N dias" prose opener; party captures allow one optional
+# OCR continuation line so multi-line names are captured in full.
+_PROSE_AOS_RE = re.compile(
+    r'Aos\s+\d{1,2}\s+dias\s+do\s+m[e\u00ea]s.{0,200}?,\s+[ao]\s+'
+    # CONTRATANTE: one line + optional continuation line
+    r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n,]{5,120}'
+    r'(?:\n[A-Z][^\n,]{3,80})?)'
+    r'(?:,\s+inscrit[ao]|,\s+CNPJ|,\s+representad)'
+    r'.{0,800}?'
+    r'e\s+[ao]\s+empresa\s+'
+    # CONTRATADA: one line + optional continuation line
+    r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n,]{5,120}'
+    r'(?:\n[A-Z][^\n,]{3,80})?)',
+    re.IGNORECASE | re.DOTALL
+)
+# Pattern 1 — "de um lado" opener
+_PROSE_LADO_RE = re.compile(
+    r'de\s+um\s+lado[,.]?\s+[ao]\s+'
+    r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n]{5,150}?)'
+    r'(?:,\s+inscrit[ao]|,\s+CNPJ|,\s+neste\s+ato|\.\s+)'
+    r'.{0,600}?'
+    r'(?:[,;]\s+e\s+(?:[ao]\s+empresa\s+)?|\be\s+[ao]\s+empresa\s+)'
+    r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^,\n]{5,150})',
+    re.IGNORECASE | re.DOTALL
+)
+# Pattern 2 — "entre si celebram", header zone only
+_PROSE_ENTRE_RE = re.compile(
+    r'entre\s+(?:si\s+)?(?:celebram\s+)?[ao]\s+'
+    r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^,\n]{10,120})'
+    r'(?:,\s+|\s+e\s+[ao]\s+(?:empresa\s+)?)'
+    r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^,\n]{10,120})',
+    re.IGNORECASE
+)
+
 # ── Clause patterns ────────────────────────────────────────────────────────────
 
 _CLAUSE_HDR_RE = re.compile(
@@ -226,7 +277,7 @@ def _remove_noise(text: str):
         if new != clean:
             removed.add(category)
         clean = new
-    clean = re.sub(r'\n{3,}', '\n\n', clean).strip()
+    clean = _BLANK_LINES_RE.sub('\n\n', clean).strip()
     return clean, sorted(removed)
 
 
@@ -295,15 +346,9 @@ def _extract_header(text: str, warnings: list) -> dict[str, str | None]:
     # Reads until the first structural field that follows the object description:
     # Valor/Vigência/Prazo/Data da assinatura/Parágrafo Primeiro/next CLÁUSULA.
     # This prevents capturing just the boilerplate opener line.
-    m = re.search(
-        r'(?:objeto\s*(?:do\s+presente)?|OBJETO)\s*[:\-]?\s*'
-        r'(.+?)'
-        r'(?=\n\s*(?:Valor|VALOR|Vig[eê]n|Prazo|PRAZO'
-        r'|Data\s+da|Par[aá]grafo\s+[Pp]rimeiro|CL[AÁ]USULA))',
-        text, re.IGNORECASE | re.DOTALL
-    )
+    m = _OBJECT_RE.search(text)
     if m:
-        obj_raw = re.sub(r'\s+', ' ', m.group(1)).strip()
+        obj_raw = _WS_RE.sub(' ', m.group(1)).strip()
         header["object_summary"] = obj_raw[:400]
 
     return header
@@ -313,16 +358,16 @@ def _clean_party(raw: str) -> str:
     # Fix C: collapse internal newlines before other stripping — handles OCR
     # line breaks inside multi-word company names e.g.:
     # "ARTE VITAL EXIBIÇÕES\nCINEMATOGRÁFICAS LTDA ME" → one clean string
-    c = re.sub(r'\s*\n\s*', ' ', raw.strip())
+    c = _LINEBREAK_RE.sub(' ', raw.strip())
     c = c.strip().rstrip(".,;:-")
-    c = re.sub(r'\s*,?\s*inscrit[ao].{0,200}$', '', c, flags=re.IGNORECASE)
-    c = re.sub(r'\s*,?\s*CNPJ.{0,100}$',        '', c, flags=re.IGNORECASE)
+    c = _INSCRITO_TAIL_RE.sub('', c)
+    c = _CNPJ_TAIL_RE.sub('', c)
 
     # Fix 1 (v7): strip trailing conjunction "e" left by "Partes: A e B" pattern.
     # e.g. "DISTRIBUIDORA DE FILMES S/A - RIOFILME e" → "DISTRIBUIDORA DE FILMES S/A - RIOFILME"
     # The word boundary \\b prevents matching "e" inside a name like "ARTE E CULTURA".
 
-    c = re.sub(r'\s+e\s*$', '', c, flags=re.IGNORECASE)
+    c = _TRAILING_E_RE.sub('', c)
     return c.strip()
 
 
@@ -342,19 +387,7 @@ def _parties_from_prose(text: str, header: dict) -> None:
     """
 
     # ── Pattern 0: "Aos N dias" opener ────────────────────────────────────────
-    m = re.search(
-        r'Aos\s+\d{1,2}\s+dias\s+do\s+m[e\u00ea]s.{0,200}?,\s+[ao]\s+'
-        # CONTRATANTE: one line + optional continuation line
-        r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n,]{5,120}'
-        r'(?:\n[A-Z][^\n,]{3,80})?)'
-        r'(?:,\s+inscrit[ao]|,\s+CNPJ|,\s+representad)'
-        r'.{0,800}?'
-        r'e\s+[ao]\s+empresa\s+'
-        # CONTRATADA: one line + optional continuation line
-        r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n,]{5,120}'
-        r'(?:\n[A-Z][^\n,]{3,80})?)',
-        text, re.IGNORECASE | re.DOTALL
-    )
+    m = _PROSE_AOS_RE.search(text)
     if m:
         if not header["contratante"]:
             header["contratante"] = _clean_party(m.group(1))
@@ -363,15 +396,7 @@ def _parties_from_prose(text: str, header: dict) -> None:
         return
 
     # ── Pattern 1: "de um lado" opener ────────────────────────────────────────
-    m = re.search(
-        r'de\s+um\s+lado[,.]?\s+[ao]\s+'
-        r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^\n]{5,150}?)'
-        r'(?:,\s+inscrit[ao]|,\s+CNPJ|,\s+neste\s+ato|\.\s+)'
-        r'.{0,600}?'
-        r'(?:[,;]\s+e\s+(?:[ao]\s+empresa\s+)?|\be\s+[ao]\s+empresa\s+)'
-        r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^,\n]{5,150})',
-        text, re.IGNORECASE | re.DOTALL
-    )
+    m = _PROSE_LADO_RE.search(text)
     if m:
         if not header["contratante"]:
             header["contratante"] = _clean_party(m.group(1))
@@ -384,13 +409,7 @@ def _parties_from_prose(text: str, header: dict) -> None:
     # (The title block "ENTRE A\nRIOFILME\nE\nA\nEMPRESA" satisfies this
     #  pattern when searched across the full text via \s+ crossing newlines.)
     hz = text[:HEADER_ZONE_CHARS]
-    m = re.search(
-        r'entre\s+(?:si\s+)?(?:celebram\s+)?[ao]\s+'
-        r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^,\n]{10,120})'
-        r'(?:,\s+|\s+e\s+[ao]\s+(?:empresa\s+)?)'
-        r'([A-Z\u00c1\u00c9\u00cd\u00d3\u00da][^,\n]{10,120})',
-        hz, re.IGNORECASE
-    )
+    m = _PROSE_ENTRE_RE.search(hz)
     if m:
         if not header["contratante"]:
             header["contratante"] = _clean_party(m.group(1))
@@ -26,12 +26,19 @@ Quality gate (Epic 2):
 
 Dependencies:
     pip install pdf2image pytesseract
+    Optional: pip install tesserocr — keeps the model loaded across pages and PDFs
     Windows: install Tesseract from https://github.com/UB-Mannheim/tesseract/wiki
     Windows: install Poppler  from https://github.com/oschwartz10612/poppler-windows
 """
+import atexit
+import functools
 import logging
 import os
 import platform
+import queue
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -54,6 +61,22 @@ POPPLER_PATH: Optional[str] = os.getenv(
     r"C:\poppler-25.12.0\Library\bin" if _WINDOWS else None,
 )
 
+# ── Parallel OCR ──────────────────────────────────────────────────────────────
+# The PDF is rasterised by one convert_from_path call, which splits the pages
+# into up to OCR_WORKERS contiguous ranges with one pdftoppm process each; the
+# pages are then OCR'd concurrently. Poppler and Tesseract both run as child
+# processes, so threads overlap them without contending for the GIL.
+# OCR_WORKERS=0 (default) means one worker per CPU core. publication_extractor
+# imports this value rather than reading the variable itself.
+OCR_WORKERS: int = int(os.getenv("OCR_WORKERS", "0")) or (os.cpu_count() or 1)
+
+if OCR_WORKERS > 1:
+    # One Tesseract per worker — stop each one from spawning its own OpenMP
+    # threads on top, which oversubscribes the CPU. Set once at import so
+    # every OCR run in the process sees the same limit; an explicit
+    # OMP_THREAD_LIMIT in the environment wins.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 # ── Quality thresholds (Epic 2) ───────────────────────────────────────────────
 MIN_TOTAL_CHARS    = 500    # minimum total characters for a valid extraction
 MIN_PRINTABLE_RATIO = 0.70  # minimum fraction of printable characters
@@ -112,8 +135,13 @@ def _quality_check(text: str) -> dict:
 # OCR ENGINE
 # ══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1)
 def _tesseract_available() -> bool:
-    """Return True if Tesseract is installed and callable."""
+    """
+    Return True if Tesseract is installed and callable.
+
+    Probed once per process — the check spawns ``tesseract --version``.
+    """
     try:
         import pytesseract
         pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
@@ -125,12 +153,128 @@ def _tesseract_available() -> bool:
         return False
 
 
+# Idle tesserocr handles, shared by every OCR thread and every PDF. A worker
+# takes one per page and puts it back afterwards, so handles outlive the
+# per-document thread pool and no more are built than pages OCR'd at once.
+_tess_idle: "queue.SimpleQueue" = queue.SimpleQueue()
+_tess_handles: list = []          # every handle built, for close_ocr_handles()
+_tess_lock = threading.Lock()
+
+
+def _tesserocr_kwargs() -> dict:
+    """PyTessBaseAPI options matching pytesseract's --psm 6 --oem 3."""
+    from tesserocr import PSM, OEM
+
+    kwargs = {"psm": PSM.SINGLE_BLOCK, "oem": OEM.DEFAULT}
+    if TESSDATA_DIR:
+        kwargs["path"] = TESSDATA_DIR
+    return kwargs
+
+
+@functools.lru_cache(maxsize=1)
+def _tesserocr_lang() -> Optional[str]:
+    """
+    Return the language tesserocr can load ('por', else 'eng'), or None.
+
+    Probed once per process, so when tesserocr is missing or has no usable
+    tessdata every page goes straight to pytesseract instead of retrying the
+    import. The handle built by a successful probe joins the idle pool.
+    """
+    try:
+        from tesserocr import PyTessBaseAPI
+        kwargs = _tesserocr_kwargs()
+    except ImportError:
+        return None
+
+    for lang in ("por", "eng"):
+        try:
+            api = PyTessBaseAPI(lang=lang, **kwargs)
+        except RuntimeError:
+            # tessdata for this language not installed — try the next one
+            continue
+        with _tess_lock:
+            _tess_handles.append(api)
+        _tess_idle.put(api)
+        return lang
+    return None
+
+
+def _new_tesserocr_api():
+    """
+    Build one more tesserocr handle in the probed language.
+
+    tesserocr (optional) keeps the language model loaded between pages,
+    whereas pytesseract launches the tesseract binary and reloads 'por'
+    for every image. One API instance cannot be used by two threads at
+    once, so each handle is held by a single worker while it OCRs a page.
+    """
+    from tesserocr import PyTessBaseAPI
+
+    api = PyTessBaseAPI(lang=_tesserocr_lang(), **_tesserocr_kwargs())
+    with _tess_lock:
+        _tess_handles.append(api)
+    return api
+
+
+def close_ocr_handles() -> None:
+    """End every tesserocr handle and free its model. Registered with atexit."""
+    with _tess_lock:
+        handles = list(_tess_handles)
+        _tess_handles.clear()
+    while True:
+        try:
+            _tess_idle.get_nowait()
+        except queue.Empty:
+            break
+    for api in handles:
+        try:
+            api.End()
+        except Exception as e:
+            logger.debug(f"   tesserocr handle close failed: {e}")
+
+
+atexit.register(close_ocr_handles)
+
+
+def _ocr_image(image) -> str:
+    """OCR one page image (or image path) in Portuguese, falling back to English."""
+    if _tesserocr_lang() is not None:
+        try:
+            api = _tess_idle.get_nowait()
+        except queue.Empty:
+            api = _new_tesserocr_api()
+        try:
+            if isinstance(image, (str, Path)):
+                api.SetImageFile(str(image))
+            else:
+                api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            _tess_idle.put(api)
+
+    import pytesseract
+
+    try:
+        return pytesseract.image_to_string(
+            image, lang="por", config="--psm 6 --oem 3"
+        )
+    except Exception:
+        # Portuguese tessdata not installed — fall back to English
+        return pytesseract.image_to_string(
+            image, lang="eng", config="--psm 6 --oem 3"
+        )
+
+
 def _extract_ocr(pdf_path: str) -> Optional[dict]:
     """
     Extract text from every page via pdf2image + Tesseract.
 
-    Rasterises each page at 300 DPI and runs OCR with the Portuguese
-    language pack (falls back to English if 'por' is not installed).
+    Rasterises the whole document at 300 DPI with one convert_from_path
+    call (up to OCR_WORKERS pdftoppm processes, each on its own page range;
+    page images go to a temp directory, not memory), then runs OCR with the
+    Portuguese language pack (falls back to English if 'por' is not
+    installed). Pages are OCR'd on up to OCR_WORKERS threads; the output
+    keeps page order.
 
     Returns:
         {
@@ -150,7 +294,7 @@ def _extract_ocr(pdf_path: str) -> Optional[dict]:
 
     try:
         from pdf2image import convert_from_path
-        import pytesseract
+        import pytesseract  # noqa: F401 — availability check
     except ImportError:
         logger.error(
             "   ✗ pdf2image not installed.\n"
@@ -164,26 +308,24 @@ def _extract_ocr(pdf_path: str) -> Optional[dict]:
         if POPPLER_PATH:
             kwargs["poppler_path"] = POPPLER_PATH
 
-        pages      = convert_from_path(pdf_path, dpi=300, **kwargs)
-        total_pages = len(pages)
-        texts       = []
-
-        for i, page_img in enumerate(pages, 1):
-            logger.debug(f"   🔍 OCR page {i}/{total_pages}...")
-            try:
-                t = pytesseract.image_to_string(
-                    page_img, lang="por", config="--psm 6 --oem 3"
-                )
-            except Exception:
-                # Portuguese tessdata not installed — fall back to English
-                t = pytesseract.image_to_string(
-                    page_img, lang="eng", config="--psm 6 --oem 3"
-                )
-            texts.append(t)
+        with tempfile.TemporaryDirectory(prefix="ocr_") as tmp_dir:
+            # One call for the whole document: pdf2image starts one pdftoppm
+            # per thread_count slot, each on a contiguous page range, so
+            # Poppler startup + PDF parse is paid per range, not per page.
+            page_paths = convert_from_path(
+                pdf_path, dpi=300, output_folder=tmp_dir, paths_only=True,
+                thread_count=OCR_WORKERS, **kwargs,
+            )
+            total_pages = len(page_paths)
+            workers     = max(1, min(OCR_WORKERS, total_pages))
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                texts = list(pool.map(_ocr_image, page_paths))
 
         text = "\n\n".join(texts)
         logger.info(
-            f"   📄 OCR: {total_pages} page(s), {len(text):,} total chars"
+            f"   📄 OCR: {total_pages} page(s), {len(text):,} total chars "
+            f"({workers} worker(s))"
         )
         return {
             "text":   text,
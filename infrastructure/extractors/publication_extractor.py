@@ -61,12 +61,16 @@ Return schema (superset of pdf_text_extractor.extract_text)
     }
 """
 
+import functools
 import logging
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from infrastructure.extractors.pdf_text_extractor import OCR_WORKERS
+
 logger = logging.getLogger(__name__)
 
 # ── Platform ──────────────────────────────────────────────────────────────────
@@ -96,6 +100,8 @@ OCR_LANG_PRIMARY    = "por"  # Portuguese tessdata (preferred)
 OCR_LANG_FALLBACK   = "eng"  # English tessdata (if por not installed)
 OCR_PSM_COLUMN      = "6"    # Single uniform block — correct for a narrow strip
 OCR_OEM             = "3"    # Default LSTM engine
+# Pages are OCR'd on up to OCR_WORKERS threads (imported from
+# pdf_text_extractor, which also sets OMP_THREAD_LIMIT for parallel runs).
 
 # Column detection: fraction of page width that constitutes a gutter
 # A vertical band with ≥ GUTTER_WHITE_THRESHOLD fraction of white pixels
@@ -332,6 +338,44 @@ def _ocr_strip(strip_image, strip_label: str = "") -> str:
         return ""
 
 
+def _ocr_page_columns(page_num: int, page_img, total_pages: int) -> str:
+    """Detect columns on one page image, OCR each strip left-to-right."""
+    col_count = _detect_column_count(page_img)
+    strips    = _split_columns(page_img, col_count)
+
+    logger.debug(
+        f"   🔍 Page {page_num}/{total_pages}: "
+        f"{col_count} column(s) detected"
+    )
+
+    strip_texts = []
+    for col_idx, strip in enumerate(strips, 1):
+        label = f"page {page_num} col {col_idx}/{col_count}"
+        text  = _ocr_strip(strip, strip_label=label)
+        if text:
+            strip_texts.append(text)
+
+    # Join columns with a clear separator so the reader knows where
+    # the column break occurred — useful for downstream parsing
+    return "\n\n--- COLUMN BREAK ---\n\n".join(strip_texts)
+
+
+@functools.lru_cache(maxsize=1)
+def _tesseract_probe_error() -> Optional[str]:
+    """
+    Run ``tesseract --version`` once per process.
+
+    Returns None when Tesseract is callable, otherwise the error text.
+    """
+    try:
+        import pytesseract
+        pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+        pytesseract.get_tesseract_version()
+        return None
+    except Exception as exc:
+        return str(exc) or type(exc).__name__
+
+
 def _extract_ocr_columns(pdf_path: str) -> Optional[dict]:
     """
     Extract text from a scanned gazette PDF using column-aware OCR.
@@ -343,7 +387,8 @@ def _extract_ocr_columns(pdf_path: str) -> Optional[dict]:
         4. OCR each strip independently with --psm 6
         5. Concatenate strips left-to-right
 
-    All pages are concatenated in order with a page separator.
+    Pages are processed on up to OCR_WORKERS threads and concatenated in
+    order with a page separator.
 
     Returns:
         { "text": str, "pages": int, "source": "ocr_columns" }
@@ -360,12 +405,10 @@ def _extract_ocr_columns(pdf_path: str) -> Optional[dict]:
         )
         return None
 
-    try:
-        pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
-        pytesseract.get_tesseract_version()
-    except Exception as exc:
+    tesseract_error = _tesseract_probe_error()
+    if tesseract_error:
         logger.error(
-            f"   ✗ Tesseract not available: {exc}\n"
+            f"   ✗ Tesseract not available: {tesseract_error}\n"
             f"     Set TESSERACT_PATH env var to the tesseract executable."
         )
         return None
@@ -377,28 +420,13 @@ def _extract_ocr_columns(pdf_path: str) -> Optional[dict]:
 
         images      = convert_from_path(pdf_path, dpi=OCR_DPI, **kwargs)
         total_pages = len(images)
-        page_texts  = []
-
-        for page_num, page_img in enumerate(images, 1):
-            col_count = _detect_column_count(page_img)
-            strips    = _split_columns(page_img, col_count)
-
-            logger.debug(
-                f"   🔍 Page {page_num}/{total_pages}: "
-                f"{col_count} column(s) detected"
-            )
-
-            strip_texts = []
-            for col_idx, strip in enumerate(strips, 1):
-                label = f"page {page_num} col {col_idx}/{col_count}"
-                text  = _ocr_strip(strip, strip_label=label)
-                if text:
-                    strip_texts.append(text)
+        workers     = max(1, min(OCR_WORKERS, total_pages))
 
-            # Join columns with a clear separator so the reader knows where
-            # the column break occurred — useful for downstream parsing
-            page_text = "\n\n--- COLUMN BREAK ---\n\n".join(strip_texts)
-            page_texts.append(page_text)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            page_texts = list(pool.map(
+                lambda item: _ocr_page_columns(item[0], item[1], total_pages),
+                enumerate(images, 1),
+            ))
 
         full_text = "\n\n--- PAGE BREAK ---\n\n".join(page_texts)
 
@@ -471,13 +499,13 @@ def validate_processo_in_text(text: str, processo_id: str) -> dict:
         )
         variations = [processo_id]
 
-    import re
+    # Lower-case the page once; each variation is then a plain substring
+    # test (C-level search) instead of a fresh IGNORECASE regex scan.
+    # The ID may be surrounded by spaces, colons, newlines, or "Processo".
+    lowered = text.lower()
 
     for variation in variations:
-        # Use word-boundary-aware search: the ID may be surrounded by
-        # spaces, colons, newlines, or the word "Processo"
-        pattern = re.escape(variation)
-        if re.search(pattern, text, re.IGNORECASE):
+        if variation.lower() in lowered:
             logger.debug(
                 f"   ✓ ID found in text via variation: '{variation}'"
             )
@@ -5,8 +5,6 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
-import pandas as pd
-
 
 ALERT_CSV_COLUMNS = [
     "processo_id",
@@ -54,6 +52,8 @@ def write_alerts_csv(alerts: list[dict], csv_path: Path) -> Path:
 
 
 def write_alerts_xlsx(alerts: list[dict], xlsx_path: Path) -> Path:
+    import pandas as pd
+
     xlsx_path.parent.mkdir(parents=True, exist_ok=True)
     rows = [_row_from_alert(alert) for alert in alerts]
     frame = pd.DataFrame(rows, columns=ALERT_CSV_COLUMNS)
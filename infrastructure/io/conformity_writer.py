@@ -7,9 +7,22 @@ Writers for Epic 5 conformity outputs.
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 
+def _write_json_atomic(payload: dict, out_path: Path) -> None:
+    # Serialise once, write beside the target, then rename over it — a crash
+    # mid-write never leaves a truncated JSON for Stage 6 to choke on.
+    data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, out_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def write_conformity_result(
     processo_id: str,
     result: dict,
@@ -18,17 +31,11 @@ def write_conformity_result(
     conformity_dir.mkdir(parents=True, exist_ok=True)
     safe_pid = processo_id.replace("/", "_").replace("\\", "_")
     out_path = conformity_dir / f"{safe_pid}_conformity.json"
-    out_path.write_text(
-        json.dumps(result, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    _write_json_atomic(result, out_path)
     return out_path
 
 
 def write_conformity_summary(summary: dict, summary_path: Path) -> Path:
     summary_path.parent.mkdir(parents=True, exist_ok=True)
-    summary_path.write_text(
-        json.dumps(summary, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    _write_json_atomic(summary, summary_path)
     return summary_path
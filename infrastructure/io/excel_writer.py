@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 import logging
 from datetime import datetime
@@ -11,6 +12,7 @@ from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
 from config.settings import ALERTS_DIR
+from infrastructure.io.state_index_builder import sanitize_pid
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,16 @@ STATUS_FILLS: dict[str, str] = {
 HEADER_FILL = "1F3864"
 HEADER_FONT_COLOR = "FFFFFF"
 
+# Style objects built once and shared by every cell, instead of a new
+# PatternFill/Font per row.
+_STATUS_PATTERN_FILLS: dict[str, PatternFill] = {
+    status: PatternFill(start_color=fill_hex, end_color=fill_hex, fill_type="solid")
+    for status, fill_hex in STATUS_FILLS.items()
+}
+_HEADER_PATTERN_FILL = PatternFill(start_color=HEADER_FILL, end_color=HEADER_FILL, fill_type="solid")
+_HEADER_FONT = Font(bold=True, color=HEADER_FONT_COLOR)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+
 _S1_COLS = ["Métrica", "Valor"]
 
 _S2_COLS = [
@@ -46,13 +58,12 @@ _S2_COLS = [
 
 _S6_COLS = ["Parâmetro", "Valor"]
 
-
-def _sanitize(pid: str) -> str:
-    try:
-        return str(pid).replace("/", "_").replace("\\", "_")
-    except Exception as exc:
-        logger.warning("Failed to sanitize pid '%s': %s", pid, exc)
-        return ""
+_MISSING_PHASE: dict[str, str] = {
+    "DISCOVERED": "Extração de Contrato",
+    "EXTRACTED": "Extração de Publicação",
+    "PUB_FOUND": "Pré-processamento",
+    "PREPROCESSED": "Análise de Conformidade",
+}
 
 
 def _safe_str(value: Any) -> str:
@@ -89,18 +100,18 @@ def _make_header_row(ws, cols: list[str]) -> None:
     try:
         for col_index, col_name in enumerate(cols, start=1):
             cell = ws.cell(row=1, column=col_index, value=col_name)
-            cell.fill = PatternFill(start_color=HEADER_FILL, end_color=HEADER_FILL, fill_type="solid")
-            cell.font = Font(bold=True, color=HEADER_FONT_COLOR)
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            cell.fill = _HEADER_PATTERN_FILL
+            cell.font = _HEADER_FONT
+            cell.alignment = _HEADER_ALIGNMENT
     except Exception as exc:
         logger.warning("Failed to create header row on sheet '%s': %s", _safe_str(ws.title), exc)
 
 
 def _apply_status_fill(cell, status: str) -> None:
     try:
-        fill_hex = STATUS_FILLS.get(_safe_str(status), "")
-        if fill_hex:
-            cell.fill = PatternFill(start_color=fill_hex, end_color=fill_hex, fill_type="solid")
+        fill = _STATUS_PATTERN_FILLS.get(_safe_str(status))
+        if fill is not None:
+            cell.fill = fill
     except Exception as exc:
         logger.warning("Failed applying status fill for status '%s': %s", status, exc)
 
@@ -217,7 +228,7 @@ def _load_alert_level_for_contract(contract: dict) -> str:
             return ""
         pid_safe = _safe_str(contract.get("pid_safe", ""))
         if not pid_safe:
-            pid_safe = _sanitize(_safe_str(contract.get("processo_id", "")))
+            pid_safe = sanitize_pid(_safe_str(contract.get("processo_id", "")))
         if not pid_safe:
             return ""
 
@@ -275,13 +286,7 @@ def _build_sheet3_nao_conformes(ws, contracts: list[dict]) -> None:
 
 def _missing_phase(pipeline_stage: str) -> str:
     try:
-        mapping = {
-            "DISCOVERED": "Extração de Contrato",
-            "EXTRACTED": "Extração de Publicação",
-            "PUB_FOUND": "Pré-processamento",
-            "PREPROCESSED": "Análise de Conformidade",
-        }
-        return _safe_str(mapping.get(_safe_str(pipeline_stage), ""))
+        return _MISSING_PHASE.get(_safe_str(pipeline_stage), "")
     except Exception:
         return ""
 
@@ -407,30 +412,45 @@ def write_excel_report(
         return output_path
 
 
-def write_excel_filtered(contracts: list[dict], output_path: Path, analyst_name: str = "") -> Path:
-    try:
-        wb = openpyxl.Workbook()
-        active_sheet = wb.active
-        if active_sheet is not None:
-            wb.remove(active_sheet)
+def _build_filtered_workbook(contracts: list[dict], analyst_name: str) -> openpyxl.Workbook:
+    wb = openpyxl.Workbook()
+    active_sheet = wb.active
+    if active_sheet is not None:
+        wb.remove(active_sheet)
 
-        ws1 = wb.create_sheet("Resultados")
-        _build_sheet2_resultados(ws1, contracts if isinstance(contracts, list) else [])
+    ws1 = wb.create_sheet("Resultados")
+    _build_sheet2_resultados(ws1, contracts if isinstance(contracts, list) else [])
+
+    ws2 = wb.create_sheet("Metadados")
+    _make_header_row(ws2, _S6_COLS)
+    rows = [
+        ("Analista", _safe_str(analyst_name) or "Sistema"),
+        ("Data de Geração", datetime.now().isoformat()),
+    ]
+    for row_index, (key, value) in enumerate(rows, start=2):
+        ws2.cell(row=row_index, column=1, value=key)
+        ws2.cell(row=row_index, column=2, value=value)
+    _set_column_widths(ws2, {1: 24, 2: 36})
+    return wb
 
-        ws2 = wb.create_sheet("Metadados")
-        _make_header_row(ws2, _S6_COLS)
-        rows = [
-            ("Analista", _safe_str(analyst_name) or "Sistema"),
-            ("Data de Geração", datetime.now().isoformat()),
-        ]
-        for row_index, (key, value) in enumerate(rows, start=2):
-            ws2.cell(row=row_index, column=1, value=key)
-            ws2.cell(row=row_index, column=2, value=value)
-        _set_column_widths(ws2, {1: 24, 2: 36})
 
+def write_excel_filtered(contracts: list[dict], output_path: Path, analyst_name: str = "") -> Path:
+    try:
+        wb = _build_filtered_workbook(contracts, analyst_name)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         wb.save(output_path)
         return output_path
     except Exception as exc:
         logger.warning("Failed to write filtered excel report: %s", exc)
         return output_path
+
+
+def build_excel_filtered_bytes(contracts: list[dict], analyst_name: str = "") -> bytes:
+    # In-memory variant for dashboard downloads — no temp file on disk.
+    try:
+        buffer = io.BytesIO()
+        _build_filtered_workbook(contracts, analyst_name).save(buffer)
+        return buffer.getvalue()
+    except Exception as exc:
+        logger.warning("Failed to build filtered excel bytes: %s", exc)
+        return b""
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -15,26 +14,19 @@ from config.settings import (
     EXTRACTIONS_DIR,
     PREPROCESSED_DIR,
 )
-from infrastructure.io.state_index_builder import build_state_index, DISCOVERY_FILE
+from infrastructure.io.state_index_builder import build_state_index, DISCOVERY_FILE, sanitize_pid
+from infrastructure.persistence import json_codec
 
 logger = logging.getLogger(__name__)
 
 
 def _load_json(path: Path) -> dict | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_codec.loads(path.read_bytes())
     except Exception:
         return None
 
 
-def _sanitize(pid: str) -> str:
-    try:
-        return str(pid).replace("/", "_").replace("\\", "_")
-    except Exception as exc:
-        logger.warning("Failed to sanitize pid '%s': %s", pid, exc)
-        return ""
-
-
 def _load_raw_metadata(pid_safe: str) -> dict:
     try:
         path = EXTRACTIONS_DIR / f"{pid_safe}_raw.json"
@@ -134,7 +126,7 @@ def build_aggregate_report(discovery_file: Path = DISCOVERY_FILE, state_index: d
         for row in conformity_rows:
             try:
                 pid = str(row.get("processo_id", ""))
-                pid_safe = _sanitize(pid)
+                pid_safe = sanitize_pid(pid)
                 if pid_safe:
                     conformity_by_safe[pid_safe] = row
             except Exception:
@@ -154,6 +146,12 @@ def build_aggregate_report(discovery_file: Path = DISCOVERY_FILE, state_index: d
 
         rule_totals = {"R001": 0.0, "R002": 0.0, "R003": 0.0, "R004": 0.0}
 
+        # Coverage counts are taken in the row loop below, from the state
+        # entry already in hand, instead of re-scanning the rows per count.
+        total_extracted = 0
+        total_pub_found = 0
+        total_preprocessed = 0
+
         for pid_safe, state_meta in contracts_index.items():
             try:
                 if not isinstance(state_meta, dict):
@@ -174,15 +172,23 @@ def build_aggregate_report(discovery_file: Path = DISCOVERY_FILE, state_index: d
                 requires_review = False
 
                 if isinstance(conformity, dict):
-                    score_breakdown = conformity.get("score_breakdown", {}) if isinstance(conformity.get("score_breakdown", {}), dict) else {}
-                    diagnostic = conformity.get("diagnostic", {}) if isinstance(conformity.get("diagnostic", {}), dict) else {}
+                    score_breakdown = conformity.get("score_breakdown", {})
+                    if not isinstance(score_breakdown, dict):
+                        score_breakdown = {}
+                    diagnostic = conformity.get("diagnostic", {})
+                    if not isinstance(diagnostic, dict):
+                        diagnostic = {}
                     overall_status = str(conformity.get("overall_status", ""))
                     try:
                         conformity_score = float(conformity.get("conformity_score", 0.0) or 0.0)
                     except Exception:
                         conformity_score = 0.0
-                    flags = conformity.get("flags", []) if isinstance(conformity.get("flags", []), list) else []
-                    recommendations = conformity.get("recommendations", []) if isinstance(conformity.get("recommendations", []), list) else []
+                    flags = conformity.get("flags", [])
+                    if not isinstance(flags, list):
+                        flags = []
+                    recommendations = conformity.get("recommendations", [])
+                    if not isinstance(recommendations, list):
+                        recommendations = []
                     requires_review = bool(conformity.get("requires_review", False))
 
                     analyzed_count += 1
@@ -190,10 +196,15 @@ def build_aggregate_report(discovery_file: Path = DISCOVERY_FILE, state_index: d
                     if overall_status in status_counts:
                         status_counts[overall_status] += 1
 
-                r001_score = float(score_breakdown.get("R001", {}).get("score", 0.0) or 0.0)
-                r002_score = float(score_breakdown.get("R002", {}).get("score", 0.0) or 0.0)
-                r003_score = float(score_breakdown.get("R003", {}).get("score", 0.0) or 0.0)
-                r004_score = float(score_breakdown.get("R004", {}).get("score", 0.0) or 0.0)
+                # Each rule entry is looked up once and reused for score and verdict.
+                r001 = score_breakdown.get("R001", {})
+                r002 = score_breakdown.get("R002", {})
+                r003 = score_breakdown.get("R003", {})
+                r004 = score_breakdown.get("R004", {})
+                r001_score = float(r001.get("score", 0.0) or 0.0)
+                r002_score = float(r002.get("score", 0.0) or 0.0)
+                r003_score = float(r003.get("score", 0.0) or 0.0)
+                r004_score = float(r004.get("score", 0.0) or 0.0)
 
                 if conformity is not None:
                     rule_totals["R001"] += r001_score
@@ -218,13 +229,13 @@ def build_aggregate_report(discovery_file: Path = DISCOVERY_FILE, state_index: d
                     "conformity_score": float(conformity_score),
                     "agreement_level": str(diagnostic.get("agreement_level", "")),
                     "R001_score": r001_score,
-                    "R001_verdict": str(score_breakdown.get("R001", {}).get("verdict", "")),
+                    "R001_verdict": str(r001.get("verdict", "")),
                     "R002_score": r002_score,
-                    "R002_verdict": str(score_breakdown.get("R002", {}).get("verdict", "")),
+                    "R002_verdict": str(r002.get("verdict", "")),
                     "R003_score": r003_score,
-                    "R003_verdict": str(score_breakdown.get("R003", {}).get("verdict", "")),
+                    "R003_verdict": str(r003.get("verdict", "")),
                     "R004_score": r004_score,
-                    "R004_verdict": str(score_breakdown.get("R004", {}).get("verdict", "")),
+                    "R004_verdict": str(r004.get("verdict", "")),
                     "flags": flags,
                     "recommendations": recommendations,
                     "requires_review": bool(requires_review),
@@ -234,19 +245,17 @@ def build_aggregate_report(discovery_file: Path = DISCOVERY_FILE, state_index: d
                 }
 
                 contract_rows.append(row)
+                if state_meta.get("has_raw", False):
+                    total_extracted += 1
+                if state_meta.get("has_pub_raw", False):
+                    total_pub_found += 1
+                if state_meta.get("has_preprocessed", False) and state_meta.get("has_pub_structured", False):
+                    total_preprocessed += 1
             except Exception as exc:
                 logger.warning("Failed building row for %s: %s", pid_safe, exc)
                 continue
 
         total_discovered = int(state_index.get("total_pids", 0) if isinstance(state_index, dict) else 0)
-        total_extracted = sum(1 for row in contract_rows if bool((contracts_index.get(row.get("pid_safe", ""), {}) or {}).get("has_raw", False)))
-        total_pub_found = sum(1 for row in contract_rows if bool((contracts_index.get(row.get("pid_safe", ""), {}) or {}).get("has_pub_raw", False)))
-        total_preprocessed = sum(
-            1
-            for row in contract_rows
-            if bool((contracts_index.get(row.get("pid_safe", ""), {}) or {}).get("has_preprocessed", False))
-            and bool((contracts_index.get(row.get("pid_safe", ""), {}) or {}).get("has_pub_structured", False))
-        )
         total_analyzed = analyzed_count
 
         coverage_rate = float(total_analyzed / total_discovered) if total_discovered > 0 else 0.0
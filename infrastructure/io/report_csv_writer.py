@@ -92,16 +92,24 @@ def _row(contract: dict, generated_at: str) -> dict:
         return fallback
 
 
+def _write_rows(csv_file, contracts: list[dict], generated_at: str) -> None:
+    # _row() already yields values in REPORT_CSV_COLUMNS order, so rows go out
+    # through csv.writer directly — DictWriter would rebuild a list from each
+    # dict and diff its keys against the header on every row.
+    writer = csv.writer(csv_file)
+    writer.writerow(REPORT_CSV_COLUMNS)
+    writer.writerows(
+        _row(contract if isinstance(contract, dict) else {}, generated_at).values() for contract in contracts
+    )
+
+
 def write_report_csv(contracts: list[dict], output_path: Path, generated_at: str) -> Path:
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         rows = contracts if isinstance(contracts, list) else []
 
         with output_path.open("w", encoding="utf-8-sig", newline="") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=REPORT_CSV_COLUMNS)
-            writer.writeheader()
-            for contract in rows:
-                writer.writerow(_row(contract if isinstance(contract, dict) else {}, generated_at))
+            _write_rows(csv_file, rows, generated_at)
 
         return output_path
     except Exception as exc:
@@ -109,18 +117,20 @@ def write_report_csv(contracts: list[dict], output_path: Path, generated_at: str
         return output_path
 
 
+def _csv_bytes(contracts: list[dict], generated_at: str) -> bytes:
+    # Encode into the byte buffer as rows are written, rather than building
+    # the whole CSV as a str and encoding it again at the end.
+    buffer = io.BytesIO()
+    text = io.TextIOWrapper(buffer, encoding="utf-8-sig", newline="")
+    _write_rows(text, contracts, generated_at)
+    text.flush()
+    text.detach()
+    return buffer.getvalue()
+
+
 def build_report_csv_bytes(contracts: list[dict], generated_at: str) -> bytes:
     try:
-        rows = contracts if isinstance(contracts, list) else []
-        buffer = io.StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=REPORT_CSV_COLUMNS)
-        writer.writeheader()
-        for contract in rows:
-            writer.writerow(_row(contract if isinstance(contract, dict) else {}, generated_at))
-        return buffer.getvalue().encode("utf-8-sig")
+        return _csv_bytes(contracts if isinstance(contracts, list) else [], generated_at)
     except Exception as exc:
         logger.warning("Failed to build report CSV bytes: %s", exc)
-        fallback_buffer = io.StringIO()
-        writer = csv.DictWriter(fallback_buffer, fieldnames=REPORT_CSV_COLUMNS)
-        writer.writeheader()
-        return fallback_buffer.getvalue().encode("utf-8-sig")
+        return _csv_bytes([], generated_at)
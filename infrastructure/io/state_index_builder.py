@@ -54,9 +54,15 @@ def _empty_load_skeleton() -> dict:
     }
 
 
-def _sanitize(pid: str) -> str:
+# Path separators → "_" in a single pass. sanitize_pid is the one
+# processo_id → pid_safe mapping for the index, the aggregate report, the
+# Excel writer and the dashboard reader.
+_PID_SAFE_TABLE = str.maketrans({"/": "_", "\\": "_"})
+
+
+def sanitize_pid(pid: str) -> str:
     try:
-        return str(pid).replace("/", "_").replace("\\", "_")
+        return str(pid).translate(_PID_SAFE_TABLE)
     except Exception as exc:
         logger.warning("Failed to sanitize pid '%s': %s", pid, exc)
         return ""
@@ -84,24 +90,31 @@ def _has_error_flag(json_path: Path) -> bool:
         return False
 
 
-def _compute_stage(pid_safe: str) -> str:
+def _artifact_paths(pid_safe: str) -> dict[str, Path]:
+    return {
+        "raw": EXTRACTIONS_DIR / f"{pid_safe}_raw.json",
+        "pub_raw": EXTRACTIONS_DIR / f"{pid_safe}_publications_raw.json",
+        "preprocessed": PREPROCESSED_DIR / f"{pid_safe}_preprocessed.json",
+        "pub_structured": PREPROCESSED_DIR / f"{pid_safe}_publication_structured.json",
+        "compliance": COMPLIANCE_DIR / f"{pid_safe}_compliance.json",
+        "conformity": CONFORMITY_DIR / f"{pid_safe}_conformity.json",
+    }
+
+
+def _compute_stage(pid_safe: str, present: dict[str, bool] | None = None) -> str:
     try:
-        conformity_path = CONFORMITY_DIR / f"{pid_safe}_conformity.json"
-        compliance_path = COMPLIANCE_DIR / f"{pid_safe}_compliance.json"
-        preprocessed_path = PREPROCESSED_DIR / f"{pid_safe}_preprocessed.json"
-        publication_structured_path = PREPROCESSED_DIR / f"{pid_safe}_publication_structured.json"
-        publication_raw_path = EXTRACTIONS_DIR / f"{pid_safe}_publications_raw.json"
-        raw_path = EXTRACTIONS_DIR / f"{pid_safe}_raw.json"
-
-        if conformity_path.exists():
+        if present is None:
+            present = {key: path.exists() for key, path in _artifact_paths(pid_safe).items()}
+
+        if present["conformity"]:
             return "SCORED"
-        if compliance_path.exists():
+        if present["compliance"]:
             return "COMPLIANCE"
-        if preprocessed_path.exists() and publication_structured_path.exists():
+        if present["preprocessed"] and present["pub_structured"]:
             return "PREPROCESSED"
-        if publication_raw_path.exists():
+        if present["pub_raw"]:
             return "PUB_FOUND"
-        if raw_path.exists():
+        if present["raw"]:
             return "EXTRACTED"
         return "DISCOVERED"
     except Exception as exc:
@@ -145,40 +158,30 @@ def build_state_index(discovery_file: Path = DISCOVERY_FILE) -> dict:
             if not pid:
                 continue
 
-            pid_safe = _sanitize(pid)
+            pid_safe = sanitize_pid(pid)
             if not pid_safe:
                 continue
 
-            stage = _compute_stage(pid_safe)
-
-            raw_path = EXTRACTIONS_DIR / f"{pid_safe}_raw.json"
-            pub_raw_path = EXTRACTIONS_DIR / f"{pid_safe}_publications_raw.json"
-            preprocessed_path = PREPROCESSED_DIR / f"{pid_safe}_preprocessed.json"
-            pub_structured_path = PREPROCESSED_DIR / f"{pid_safe}_publication_structured.json"
-            compliance_path = COMPLIANCE_DIR / f"{pid_safe}_compliance.json"
-            conformity_path = CONFORMITY_DIR / f"{pid_safe}_conformity.json"
+            # Stat each artifact once — stage, error flag and has_* reuse it
+            paths = _artifact_paths(pid_safe)
+            present = {key: path.exists() for key, path in paths.items()}
+            stage = _compute_stage(pid_safe, present)
 
             error_flag = False
-            if conformity_path.exists():
-                error_flag = _has_error_flag(conformity_path)
-            elif compliance_path.exists():
-                error_flag = _has_error_flag(compliance_path)
-            elif preprocessed_path.exists():
-                error_flag = _has_error_flag(preprocessed_path)
-            elif pub_raw_path.exists():
-                error_flag = _has_error_flag(pub_raw_path)
-            elif raw_path.exists():
-                error_flag = _has_error_flag(raw_path)
+            for key in ("conformity", "compliance", "preprocessed", "pub_raw", "raw"):
+                if present[key]:
+                    error_flag = _has_error_flag(paths[key])
+                    break
 
             contracts[pid_safe] = {
                 "processo_id": pid,
                 "pipeline_stage": stage,
-                "has_raw": raw_path.exists(),
-                "has_pub_raw": pub_raw_path.exists(),
-                "has_preprocessed": preprocessed_path.exists(),
-                "has_pub_structured": pub_structured_path.exists(),
-                "has_compliance": compliance_path.exists(),
-                "has_conformity": conformity_path.exists(),
+                "has_raw": present["raw"],
+                "has_pub_raw": present["pub_raw"],
+                "has_preprocessed": present["preprocessed"],
+                "has_pub_structured": present["pub_structured"],
+                "has_compliance": present["compliance"],
+                "has_conformity": present["conformity"],
                 "error_flag": bool(error_flag),
             }
 
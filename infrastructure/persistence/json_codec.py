@@ -0,0 +1,84 @@
+"""
+infrastructure/persistence/json_codec.py
+
+Shared JSON encoding and decoding for the pipeline's data files.
+
+orjson is an optional dependency and is not listed in requirements.txt.
+When it is installed it encodes and parses several times faster than
+stdlib json; when it is missing every call goes through stdlib json.
+
+- loads() hands anything orjson rejects (e.g. the NaN literals written by
+  stdlib json.dumps) to json.loads, so both paths accept the same files.
+- dumps() only uses orjson for plain JSON data (dicts, lists, tuples,
+  strings, bools, None, 64-bit ints and finite floats). Everything else
+  goes to json.dumps, so NaN is still written as NaN and datetimes,
+  dataclasses or UUIDs still raise TypeError instead of being
+  silently converted. Both paths write the same values in the same
+  2-space, non-ASCII-preserving layout. Only the spelling of some
+  floats can differ (orjson writes 1e16 where json writes 1e+16).
+"""
+import json
+import math
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional — stdlib json is used instead
+    orjson = None
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes, via orjson when it is installed."""
+    if orjson is None:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+_INT_MIN, _INT_MAX = -(2 ** 63), 2 ** 64 - 1   # orjson's integer range
+
+
+def _plain_scalar(value: Any) -> bool:
+    """True for a str/bool/None/int/float that both encoders write alike."""
+    kind = type(value)
+    if kind is str or kind is bool or value is None:
+        return True
+    if kind is int:
+        return _INT_MIN <= value <= _INT_MAX
+    if kind is float:
+        return math.isfinite(value)
+    return False
+
+
+def _is_plain_json(data: Any) -> bool:
+    """True if *data* holds only types orjson and json.dumps encode identically."""
+    stack, seen = [data], set()
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict or kind is list or kind is tuple:
+            if id(value) in seen:          # shared or circular — let json decide
+                return False
+            seen.add(id(value))
+            if kind is dict:
+                if not all(_plain_scalar(key) for key in value):
+                    return False
+                stack.extend(value.values())
+            else:
+                stack.extend(value)
+        elif not _plain_scalar(value):
+            return False
+    return True
+
+
+def dumps(data: Any) -> bytes:
+    """Serialise to indented UTF-8 JSON bytes, via orjson for plain JSON data."""
+    if orjson is not None and _is_plain_json(data):
+        try:
+            # Non-str keys are stringified, as json.dumps does.
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass   # e.g. nested deeper than orjson allows
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
@@ -17,6 +17,9 @@ Design decisions
 - always UTF-8 + ensure_ascii=False so Portuguese characters (ã, ç, é…)
   are stored as real unicode, not backslash-u escaped sequences.
 - indent=2 keeps files human-readable and git-diffable.
+- encoding goes through json_codec.dumps, which uses orjson when it is
+  installed (same layout, much faster on large discovery lists) and
+  stdlib json otherwise.
 - load() returns an empty dict (not None, not an exception) when the
   file is missing — callers check keys, not None guards.
 """
@@ -25,6 +28,8 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Union
 
+from infrastructure.persistence import json_codec
+
 logger = logging.getLogger(__name__)
 
 # Type alias — save/load both accept Path or str
@@ -67,8 +72,7 @@ class JSONStorage:
 
             # Write to a temp file first, then rename — prevents partial writes
             tmp_path = path.with_suffix(".tmp")
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            tmp_path.write_bytes(json_codec.dumps(data))
 
             # Atomic rename (on the same filesystem this is one syscall)
             tmp_path.replace(path)
@@ -49,6 +49,7 @@ from config.settings import (
 from config.portals import CONTASRIO_LOCATORS
 from infrastructure.scrapers.contasrio.navigation import PathNavigator
 from infrastructure.scrapers.contasrio.parsers import CompanyRowParser
+from infrastructure.persistence.json_storage import JSONStorage
 from domain.models.processo_link import CompanyData, ProcessoLink
 
 logger = logging.getLogger(__name__)
@@ -99,8 +100,9 @@ def _save_progress(
             "processos": [p.to_dict() for p in processos],
             "errors": errors,
         }
-        with open(PROGRESS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Rewritten after every company: same atomic, orjson-backed writer
+        # as the discovery outputs.
+        JSONStorage.save(data, PROGRESS_FILE)
     except Exception as e:
         logger.error(f"   ✗ Could not save progress: {e}")
 
@@ -610,5 +612,8 @@ class ContasRioScraper:
         if not company_id or not company_name:
             return None
 
-        company_id = re.sub(r'[^A-Za-z0-9]', '', company_id).upper()
-        return (company_id, company_name)
\ No newline at end of file
+        # CNPJ ids are usually clean digit strings already; only run the
+        # regex when something besides ASCII letters/digits is present.
+        if not (company_id.isascii() and company_id.isalnum()):
+            company_id = re.sub(r'[^A-Za-z0-9]', '', company_id)
+        return (company_id.upper(), company_name)
\ No newline at end of file
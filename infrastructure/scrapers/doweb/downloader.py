@@ -63,7 +63,6 @@ Temp folder:   data/temp_downloads/  (max 1 PDF at any time)
 
 import json
 import logging
-import re
 import time
 from datetime import datetime
 from pathlib import Path
@@ -415,8 +414,9 @@ def _build_publication_record(
     qc_passes = ocr_result.get("quality_passes", False)
     qc_flags  = ocr_result.get("quality_flags", [])
 
-    processo_found = bool(
-        re.search(re.escape(processo_id), raw_text, re.IGNORECASE)
+    # Literal, case-insensitive containment — no pattern to build or compile.
+    processo_found = (
+        processo_id.lower() in raw_text.lower()
     ) if raw_text else False
 
     return {
@@ -150,6 +150,13 @@ class SearchResultItem:
 # ID NORMALIZER — public functions
 # ══════════════════════════════════════════════════════════════════════════════
 
+# One compiled pattern per ID format, shared by detect_format and the
+# format-specific normalizers.
+_FORMAT_A_RE = re.compile(r'^(\d+)\.(\d+)/(\d{4})(?:-(\d+))?$')   # 006800.000136/2026-28
+_FORMAT_B_RE = re.compile(r'^([A-Z]+)-([A-Z]+)-(\d{4})/(\d+)$')    # TUR-PRO-2025/01221
+_FORMAT_C_RE = re.compile(r'^(\d+)/(\d+)\.(\d+)/(\d{4})$')       # 12/500.078/2021
+
+
 def detect_format(processo_id: str) -> str:
     """
     Identify which of the three known ID formats applies.
@@ -162,13 +169,13 @@ def detect_format(processo_id: str) -> str:
     """
     pid = processo_id.strip()
 
-    if re.match(r'^[A-Z]+-[A-Z]+-\d{4}/\d+$', pid):
+    if _FORMAT_B_RE.match(pid):
         return "B"
 
-    if re.match(r'^\d+/\d+\.\d+/\d{4}$', pid):
+    if _FORMAT_C_RE.match(pid):
         return "C"
 
-    if re.match(r'^\d+\.\d+/\d{4}(?:-\d+)?$', pid):
+    if _FORMAT_A_RE.match(pid):
         return "A"
 
     return "UNKNOWN"
@@ -233,7 +240,7 @@ def _normalize_format_a(pid: str) -> List[str]:
     zero-padding and punctuation, so the gazette may have been published
     under any of these forms.
     """
-    m = re.match(r'^(\d+)\.(\d+)/(\d{4})(?:-(\d+))?$', pid)
+    m = _FORMAT_A_RE.match(pid)
     if not m:
         return [pid]
 
@@ -278,7 +285,7 @@ def _normalize_format_b(pid: str) -> List[str]:
 
     Variations cover presence/absence of dashes and the slash.
     """
-    m = re.match(r'^([A-Z]+)-([A-Z]+)-(\d{4})/(\d+)$', pid)
+    m = _FORMAT_B_RE.match(pid)
     if not m:
         return [pid]
 
@@ -303,7 +310,7 @@ def _normalize_format_c(pid: str) -> List[str]:
 
     Variations cover zero-padding of NUM and removal of the first slash.
     """
-    m = re.match(r'^(\d+)/(\d+)\.(\d+)/(\d{4})$', pid)
+    m = _FORMAT_C_RE.match(pid)
     if not m:
         return [pid]
 
@@ -49,10 +49,11 @@ Output JSON per contract
 """
 import json
 import logging
+import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
@@ -203,8 +204,7 @@ def _mark_no_document(progress: dict, processo_id: str) -> None:
         "at":          datetime.now().isoformat(),
     }
     # Avoid duplicate entries across re-runs
-    existing_ids = [e["processo_id"] for e in progress.get("no_document", [])]
-    if processo_id not in existing_ids:
+    if not any(e["processo_id"] == processo_id for e in progress.get("no_document", [])):
         progress.setdefault("no_document", []).append(entry)
     progress["stats"]["no_document"] = progress["stats"].get("no_document", 0) + 1
 
@@ -256,15 +256,22 @@ def _save_extraction(link: ProcessoLink, extraction: dict) -> bool:
     out_path = _extraction_path(link.processo_id)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Write to a sibling .tmp and rename over the target. A crash mid-write
+    # must never leave a partial _raw.json: _is_already_extracted() would
+    # skip it forever and Stage 3+ would fail to parse it.
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
     try:
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(record, f, ensure_ascii=False, indent=2)
-        size_kb = out_path.stat().st_size / 1024
+        payload = json.dumps(record, ensure_ascii=False, indent=2).encode("utf-8")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, out_path)
+        size_kb = len(payload) / 1024
         logger.info(f"   💾 Saved: {out_path.name} ({size_kb:.1f} KB)")
         return True
     except Exception as e:
         logger.error(f"   ✗ Could not save extraction: {e}")
         return False
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -281,6 +288,30 @@ def _delete_pdf(path: Optional[Path]) -> None:
         logger.warning(f"   ⚠ Could not delete {path}: {e}")
 
 
+def _scan_temp_dir() -> Tuple[List[Path], List[Path]]:
+    """
+    List finished and in-progress downloads in TEMP_PDF_DIR.
+
+    One os.scandir() pass instead of a glob per suffix — this runs every
+    second while a download is pending.
+
+    Returns:
+        (pdfs, partial) — paths ending in .pdf and .crdownload.
+    """
+    pdfs: List[Path] = []
+    partial: List[Path] = []
+    try:
+        with os.scandir(TEMP_PDF_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf"):
+                    pdfs.append(Path(entry.path))
+                elif entry.name.endswith(".crdownload"):
+                    partial.append(Path(entry.path))
+    except FileNotFoundError:
+        pass
+    return pdfs, partial
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DISCOVERY FILE LOADER
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -435,12 +466,15 @@ class ProcessoDownloader:
             label = f"[{i}/{total}] {pid}"
 
             # ── Skip already done ──────────────────────────────────────────────
-            if pid in completed_set or _is_already_extracted(pid):
+            # completed_set mirrors progress["completed"], so membership is
+            # checked against the set rather than scanning the list.
+            known = pid in completed_set
+            if known or _is_already_extracted(pid):
                 logger.info(f"   ⏭  {label} — already extracted")
                 skipped += 1
                 # Keep completed_set in sync in case file exists but not in progress
-                completed_set.add(pid)
-                if pid not in progress["completed"]:
+                if not known:
+                    completed_set.add(pid)
                     _mark_completed(progress, pid)
                 continue
 
@@ -753,9 +787,10 @@ class ProcessoDownloader:
         TEMP_PDF_DIR.mkdir(parents=True, exist_ok=True)
 
         # Clear any leftover files from a previous attempt
-        for stale in list(TEMP_PDF_DIR.glob("*.pdf")) + list(TEMP_PDF_DIR.glob("*.crdownload")):
+        pdfs, partial = _scan_temp_dir()
+        for stale in pdfs + partial:
             try:
-                stale.unlink()
+                stale.unlink(missing_ok=True)
             except Exception:
                 pass
 
@@ -765,8 +800,7 @@ class ProcessoDownloader:
 
             deadline = time.time() + timeout
             while time.time() < deadline:
-                pdfs        = list(TEMP_PDF_DIR.glob("*.pdf"))
-                in_progress = list(TEMP_PDF_DIR.glob("*.crdownload"))
+                pdfs, in_progress = _scan_temp_dir()
                 if pdfs and not in_progress:
                     downloaded = pdfs[0]
                     downloaded.rename(out_path)
@@ -18,6 +18,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
+    StaleElementReferenceException,
     ElementClickInterceptedException,
     ElementNotInteractableException,
 )
@@ -39,6 +40,14 @@ CAPTCHA_AUTO_WAIT = 3          # Seconds to wait after auto-actions
 CAPTCHA_MANUAL_TIMEOUT = 300   # 5 minutes for manual resolution
 
 
+def _is_displayed(element) -> bool:
+    """is_displayed(), treating an element detached since lookup as hidden."""
+    try:
+        return element.is_displayed()
+    except StaleElementReferenceException:
+        return False
+
+
 # =========================================================================
 # CAPTCHA HANDLER CLASS
 # =========================================================================
@@ -86,15 +95,16 @@ class CaptchaHandler:
             "//*[contains(text(), 'not a robot')]",
             "//div[@class='recaptcha-checkbox-border']",
         ]
-        
-        for xpath in captcha_indicators:
-            try:
-                element = self.driver.find_element(By.XPATH, xpath)
-                if element.is_displayed():
-                    return True
-            except NoSuchElementException:
-                continue
-        return False
+
+        # One XPath union → one browser round-trip instead of one per indicator.
+        # A stale element only rules itself out, not the rest of the matches;
+        # other errors (e.g. a dead session) propagate rather than reading as
+        # a clear page.
+        try:
+            elements = self.driver.find_elements(By.XPATH, " | ".join(captcha_indicators))
+        except NoSuchElementException:
+            return False
+        return any(_is_displayed(element) for element in elements)
     
     def is_on_captcha_page(self) -> bool:
         """
@@ -154,14 +164,22 @@ class CaptchaHandler:
             bool: True if the image challenge iframe is present and displayed
         """
         try:
-            for iframe in self.driver.find_elements(By.TAG_NAME, "iframe"):
-                src = iframe.get_attribute("src") or ""
-                if "bframe" in src and iframe.is_displayed():
-                    return True
-            return False
+            return self._find_bframe() is not None
         except Exception:
             return False
 
+    def _find_bframe(self):
+        """
+        Return the displayed reCAPTCHA challenge iframe, or None.
+
+        The src filter runs in the browser, so only matching iframes come
+        back — no per-iframe get_attribute() round-trips.
+        """
+        for iframe in self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='bframe']"):
+            if iframe.is_displayed():
+                return iframe
+        return None
+
     def is_grid_empty(self) -> bool:
         """
         Switch into the reCAPTCHA bframe and check whether images rendered.
@@ -174,24 +192,16 @@ class CaptchaHandler:
         Returns False → images loaded normally, or bframe not found.
         """
         try:
-            bframe = None
-            for iframe in self.driver.find_elements(By.TAG_NAME, "iframe"):
-                src = iframe.get_attribute("src") or ""
-                if "bframe" in src and iframe.is_displayed():
-                    bframe = iframe
-                    break
-
+            bframe = self._find_bframe()
             if bframe is None:
                 return False
 
             self.driver.switch_to.frame(bframe)
             try:
-                imgs = self.driver.find_elements(By.TAG_NAME, "img")
-                visible_imgs = [
-                    img for img in imgs
-                    if img.is_displayed() and img.get_attribute("src")
-                ]
-                return len(visible_imgs) == 0
+                imgs = self.driver.find_elements(
+                    By.CSS_SELECTOR, "img[src]:not([src=''])"
+                )
+                return not any(img.is_displayed() for img in imgs)
             finally:
                 self.driver.switch_to.default_content()
 
@@ -219,13 +229,10 @@ class CaptchaHandler:
     def click_recaptcha_checkbox(self) -> bool:
         """Switch into the reCAPTCHA iframe and click the checkbox."""
         try:
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            recaptcha_iframe = None
-            for iframe in iframes:
-                src = iframe.get_attribute("src") or ""
-                if "recaptcha" in src.lower() and "anchor" in src.lower():
-                    recaptcha_iframe = iframe
-                    break
+            iframes = self.driver.find_elements(
+                By.CSS_SELECTOR, "iframe[src*='recaptcha' i][src*='anchor' i]"
+            )
+            recaptcha_iframe = iframes[0] if iframes else None
 
             if not recaptcha_iframe:
                 return False
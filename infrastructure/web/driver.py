@@ -3,7 +3,9 @@ WebDriver management utilities.
 Handles Chrome WebDriver initialization, configuration, and cleanup.
 """
 
+import functools
 import logging
+import shutil
 from typing import Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -21,20 +23,45 @@ from config.settings import HEADLESS_MODE, TIMEOUT_SECONDS
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process.
+
+    ``ChromeDriverManager().install()`` checks the installed Chrome version
+    and the local driver cache (and may hit the network) on every call.
+    Drivers are re-created when a session dies mid-run, so resolving the
+    path once saves that work on every restart.  Failures are not cached.
+    """
+    return ChromeDriverManager().install()
+
+
+@functools.lru_cache(maxsize=1)
+def _chrome_binary() -> Optional[str]:
+    """Locate the Chrome executable on PATH once per process."""
+    return shutil.which("chrome") or shutil.which("google-chrome")
+
+
+def _should_load_images(use_headless: bool, load_images: Optional[bool]) -> bool:
+    """Images stay on for interactive sessions so CAPTCHAs remain solvable."""
+    return (not use_headless) if load_images is None else load_images
+
+
 def _build_prefs(
     use_headless: bool,
     download_dir: Optional[str],
-    anti_detection: bool
+    anti_detection: bool,
+    load_images: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Return Chrome preferences based on flags.
 
     By default images and fonts are blocked when running headless to save
-    bandwidth.  Anti-detection mode adds several additional settings, and
-    may also configure a download directory when provided.
+    bandwidth; ``load_images`` overrides that choice explicitly.
+    Anti-detection mode adds several additional settings, and may also
+    configure a download directory when provided.
     """
 
     prefs: Dict[str, Any] = {}
-    if use_headless:
+    if not _should_load_images(use_headless, load_images):
         prefs.update({
             "profile.managed_default_content_settings.images": 2,
             "profile.managed_default_content_settings.fonts": 2,
@@ -63,6 +90,7 @@ def create_driver(
     download_dir: Optional[str] = None,
     anti_detection: bool = False,
     user_data_dir: Optional[str] = None,
+    load_images: Optional[bool] = None,
 ) -> Optional[webdriver.Chrome]:
     """
     Create and configure Chrome WebDriver.
@@ -82,6 +110,8 @@ def create_driver(
         user_data_dir: Optional Chrome profile directory; if supplied the
             browser will reuse cookies and state across invocations.  useful
             for keeping a solved CAPTCHA/cookie session alive between runs.
+        load_images: Force image/font loading on (True) or off (False).
+            None (default) loads them only in interactive sessions.
 
     Returns:
         Configured WebDriver instance or None if initialization failed
@@ -107,8 +137,7 @@ def create_driver(
         if user_data_dir:
             options.add_argument(f"--user-data-dir={user_data_dir}")
 
-        import shutil
-        chrome_bin = shutil.which("chrome") or shutil.which("google-chrome")
+        chrome_bin = _chrome_binary()
         if chrome_bin:
             options.binary_location = chrome_bin
 
@@ -131,12 +160,18 @@ def create_driver(
         options.add_argument("--disable-default-apps")
         options.add_argument("--no-first-run")
         options.add_argument("--disable-features=Translate,BackForwardCache")
+        if not _should_load_images(use_headless, load_images):
+            # The content-settings pref still lets Blink decode/lay out
+            # placeholders; this switch stops image requests altogether.
+            options.add_argument("--blink-settings=imagesEnabled=false")
         options.add_argument("--enable-logging")
         options.add_argument("--v=1")
 
         # Build preference dictionary using helper utility.  splitting
         # this out makes the behaviour easier to unit-test.
-        prefs = _build_prefs(use_headless, download_dir, anti_detection)
+        prefs = _build_prefs(
+            use_headless, download_dir, anti_detection, load_images
+        )
         options.add_experimental_option("prefs", prefs)
         
         # Disable automation flags
@@ -144,7 +179,7 @@ def create_driver(
         options.add_experimental_option('useAutomationExtension', False)
 
         # Initialize driver
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
         
         # Anti-detection: Override navigator.webdriver
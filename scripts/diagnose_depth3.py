@@ -32,7 +32,12 @@ from config.settings import CONTASRIO_CONTRACTS_URL, DISCOVERY_DIR
 setup_logging("diagnosis_v3", log_level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-CLICK_PAUSE = 3.0
+
+def wait_for_page_load(driver, timeout=30):
+    """Block until the browser reports the document as fully loaded."""
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
 
 
 def wait_for_settle(driver, timeout=15):
@@ -69,8 +74,6 @@ def click_button_by_text(driver, text):
         }
         return false;
     """, text)
-    if result:
-        time.sleep(CLICK_PAUSE)
     return bool(result)
 
 
@@ -175,7 +178,7 @@ def run():
     logger.info("🔬 DIAGNOSTIC v3 — Full Depth-3 DOM Inventory")
     logger.info("=" * 70)
 
-    driver = create_driver(headless=False, anti_detection=True)
+    driver = create_driver(headless=False, anti_detection=True, load_images=False)
     if not driver:
         logger.error("Driver init failed")
         return
@@ -188,9 +191,9 @@ def run():
     try:
         # Navigate to contracts page
         driver.get(CONTASRIO_CONTRACTS_URL)
-        time.sleep(5)
+        wait_for_page_load(driver)
         driver.refresh()
-        time.sleep(3)
+        wait_for_page_load(driver)
         WebDriverWait(driver, 30).until(
             EC.presence_of_element_located(
                 (By.CSS_SELECTOR, "td.v-grid-cell[role='gridcell']")
@@ -213,7 +216,6 @@ def run():
                     }
                 }
             """)
-            time.sleep(CLICK_PAUSE)
         wait_for_settle(driver)
 
         # ── Step 2: Click first Órgão ─────────────────────────────────────────
@@ -229,7 +231,6 @@ def run():
                     }
                 }
             """)
-            time.sleep(CLICK_PAUSE)
         wait_for_settle(driver)
 
         # ── Step 3: Click first UG ────────────────────────────────────────────
@@ -245,12 +246,10 @@ def run():
                     }
                 }
             """)
-            time.sleep(CLICK_PAUSE)
         wait_for_settle(driver)
 
         # ── We are now at Depth 3 — FULL INVENTORY ────────────────────────────
         logger.info("\n📸 At Depth 3 — Running full DOM inventory...")
-        time.sleep(2)  # Extra settle time
 
         inventory = full_dom_inventory(driver)
         result["depth3_inventory"] = inventory
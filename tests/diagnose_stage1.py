@@ -19,7 +19,6 @@ Expected duration: ~60-90 seconds (browser open the whole time)
 The browser will stay open so you can inspect it yourself.
 """
 import sys
-import time
 from pathlib import Path
 
 # Ensure project root is importable
@@ -61,7 +60,7 @@ def main():
 
     # ── Browser + navigation ──────────────────────────────────────────────────
     head("2. NAVIGATION")
-    driver = create_driver(headless=False, anti_detection=True)
+    driver = create_driver(headless=False, anti_detection=True, load_images=False)
     if not driver:
         fail("WebDriver failed to initialise — check Chrome + chromedriver")
         return
@@ -69,7 +68,9 @@ def main():
     try:
         info(f"Navigating to: {CONTASRIO_CONTRACTS_URL}")
         driver.get(CONTASRIO_CONTRACTS_URL)
-        time.sleep(3)
+        WebDriverWait(driver, 30).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
 
         current_url = driver.current_url
         info(f"Current URL after navigation: {current_url}")
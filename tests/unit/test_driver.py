@@ -16,6 +16,18 @@ def test_build_prefs_interactive_leaves_images_and_fonts():
     assert "profile.managed_default_content_settings.fonts" not in prefs
 
 
+def test_build_prefs_load_images_overrides_headless_default():
+    prefs = driver._build_prefs(
+        use_headless=True, download_dir=None, anti_detection=False, load_images=True
+    )
+    assert "profile.managed_default_content_settings.images" not in prefs
+
+    prefs = driver._build_prefs(
+        use_headless=False, download_dir=None, anti_detection=False, load_images=False
+    )
+    assert prefs.get("profile.managed_default_content_settings.images") == 2
+
+
 def test_build_prefs_anti_detection_includes_notifications_and_download():
     dl = os.getcwd()  # use cwd as dummy
     prefs = driver._build_prefs(use_headless=False, download_dir=dl, anti_detection=True)
@@ -0,0 +1,81 @@
+import sys
+import types
+
+from infrastructure.extractors import pdf_text_extractor as extractor
+
+
+def _install_fakes(monkeypatch, total_pages):
+    """Stub pdf2image/pytesseract so OCR runs without Poppler or Tesseract."""
+    pdf2image = types.ModuleType("pdf2image")
+    calls = []
+
+    def convert_from_path(path, dpi, output_folder, paths_only, **kw):
+        calls.append(path)
+        return [f"img{page}" for page in range(1, total_pages + 1)]
+
+    pdf2image.convert_from_path = convert_from_path
+    pytesseract = types.ModuleType("pytesseract")
+    pytesseract.image_to_string = lambda image, lang, config: f"text-{image}"
+
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+    monkeypatch.setattr(extractor, "_tesseract_available", lambda: True)
+    extractor._tesserocr_lang.cache_clear()  # each test installs its own tesserocr (or none)
+    return calls
+
+
+def test_extract_ocr_keeps_page_order_with_parallel_workers(monkeypatch):
+    calls = _install_fakes(monkeypatch, total_pages=7)
+    monkeypatch.setattr(extractor, "OCR_WORKERS", 4)
+
+    result = extractor._extract_ocr("contract.pdf")
+
+    assert calls == ["contract.pdf"]  # one convert_from_path call for the whole document
+    assert result["pages"] == 7
+    assert result["source"] == "ocr"
+    assert result["text"].split("\n\n") == [f"text-img{i}" for i in range(1, 8)]
+
+
+def test_extract_ocr_single_worker(monkeypatch):
+    _install_fakes(monkeypatch, total_pages=2)
+    monkeypatch.setattr(extractor, "OCR_WORKERS", 1)
+
+    result = extractor._extract_ocr("contract.pdf")
+
+    assert result["text"] == "text-img1\n\ntext-img2"
+
+
+def test_extract_ocr_prefers_persistent_tesserocr_api(monkeypatch):
+    _install_fakes(monkeypatch, total_pages=3)
+    monkeypatch.setattr(extractor, "OCR_WORKERS", 1)
+    created = []
+    ended = []
+
+    class FakeAPI:
+        def __init__(self, lang, **kw):
+            created.append(lang)
+
+        def SetImageFile(self, path):
+            self._path = path
+
+        def GetUTF8Text(self):
+            return f"api-{self._path}"
+
+        def End(self):
+            ended.append(self)
+
+    tesserocr = types.ModuleType("tesserocr")
+    tesserocr.PyTessBaseAPI = FakeAPI
+    tesserocr.PSM = types.SimpleNamespace(SINGLE_BLOCK=6)
+    tesserocr.OEM = types.SimpleNamespace(DEFAULT=3)
+    monkeypatch.setitem(sys.modules, "tesserocr", tesserocr)
+
+    result = extractor._extract_ocr("contract.pdf")
+    second = extractor._extract_ocr("other.pdf")
+
+    assert result["text"] == "api-img1\n\napi-img2\n\napi-img3"
+    assert second["text"] == result["text"]
+    assert created == ["por"]  # one handle reused for every page and PDF
+
+    extractor.close_ocr_handles()
+    assert len(ended) == 1